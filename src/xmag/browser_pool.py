@@ -0,0 +1,203 @@
+"""Long-lived Playwright browsers reused across builds."""
+
+from __future__ import annotations
+
+import atexit
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from playwright.sync_api import sync_playwright
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Playwright, Route
+
+
+@dataclass
+class _Session:
+    playwright: Playwright
+    headless: bool
+    cdp_endpoint: str | None
+    user_data_dir: Path | None
+    browser: Browser | None = None
+    persistent_context: BrowserContext | None = None
+
+
+# Extraction only reads the article DOM and image src attributes, so heavy
+# assets are dropped before they hit the network.
+_BLOCKED_RESOURCE_TYPES = frozenset({"media", "font", "stylesheet", "image"})
+_ALLOWED_IMAGE_MARKER = "twimg.com/media"
+
+# Playwright's sync API objects may only be used from the thread that created
+# them, so the pool keeps one browser per thread.
+_LOCAL = threading.local()
+
+
+def _current_session() -> _Session | None:
+    session: _Session | None = getattr(_LOCAL, "session", None)
+    return session
+
+
+def _route_essential_only(route: Route) -> None:
+    request = route.request
+    if (
+        request.resource_type in _BLOCKED_RESOURCE_TYPES
+        and _ALLOWED_IMAGE_MARKER not in request.url
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _session_matches(
+    session: _Session,
+    *,
+    headless: bool,
+    cdp_endpoint: str | None,
+    user_data_dir: Path | None,
+) -> bool:
+    if (session.headless, session.cdp_endpoint, session.user_data_dir) != (
+        headless,
+        cdp_endpoint,
+        user_data_dir,
+    ):
+        return False
+    if session.browser is not None:
+        return session.browser.is_connected()
+    return session.persistent_context is not None
+
+
+def _forget_persistent_context(session: _Session) -> None:
+    session.persistent_context = None
+
+
+def _get_session(
+    *,
+    headless: bool,
+    cdp_endpoint: str | None,
+    user_data_dir: Path | None,
+) -> _Session:
+    session = _current_session()
+    if session is not None and _session_matches(
+        session,
+        headless=headless,
+        cdp_endpoint=cdp_endpoint,
+        user_data_dir=user_data_dir,
+    ):
+        return session
+
+    close_pool()
+
+    playwright = sync_playwright().start()
+    session = _Session(
+        playwright=playwright,
+        headless=headless,
+        cdp_endpoint=cdp_endpoint,
+        user_data_dir=user_data_dir,
+    )
+    try:
+        if cdp_endpoint is not None:
+            session.browser = playwright.chromium.connect_over_cdp(cdp_endpoint)
+        elif user_data_dir is not None:
+            user_data_dir.mkdir(parents=True, exist_ok=True)
+            # No request routing here: Playwright disables the HTTP cache for
+            # routed contexts, and keeping X's assets cached across runs is the
+            # point of a persistent profile, so caching wins over blocking.
+            context = playwright.chromium.launch_persistent_context(
+                str(user_data_dir),
+                headless=headless,
+                service_workers="block",
+            )
+            # A profile that closes under us (a crash, or the user closing a
+            # headful window) must be relaunched on next use, not handed out again.
+            context.on("close", lambda _: _forget_persistent_context(session))
+            session.persistent_context = context
+        else:
+            session.browser = playwright.chromium.launch(headless=headless)
+    except Exception:
+        playwright.stop()
+        raise
+
+    _LOCAL.session = session
+    return session
+
+
+def _load_storage_cookies(context: BrowserContext, storage_state: Path) -> None:
+    # Persistent contexts cannot be created from a storage state file, so
+    # carry its cookies over instead.
+    state = json.loads(storage_state.read_text(encoding="utf-8"))
+    cookies = state.get("cookies", []) if isinstance(state, dict) else []
+    if cookies:
+        context.add_cookies(cookies)
+
+
+def acquire_context(
+    *,
+    headless: bool = True,
+    storage_state: Path | None = None,
+    cdp_endpoint: str | None = None,
+    user_data_dir: Path | None = None,
+) -> BrowserContext:
+    """Open a context on the calling thread's pooled browser, launching it on first use."""
+
+    session = _get_session(
+        headless=headless,
+        cdp_endpoint=cdp_endpoint,
+        user_data_dir=user_data_dir if cdp_endpoint is None else None,
+    )
+
+    # A persistent profile (user_data_dir) is one shared context that keeps its
+    # HTTP cache and cookies between runs; it skips resource blocking so cached
+    # assets are served from disk instead.
+    if session.persistent_context is not None:
+        if storage_state is not None:
+            _load_storage_cookies(session.persistent_context, storage_state)
+        return session.persistent_context
+
+    browser = session.browser
+    if browser is None:  # pragma: no cover - sessions hold a browser or a persistent context
+        raise RuntimeError("Browser pool session has no browser")
+
+    if storage_state is not None:
+        context = browser.new_context(service_workers="block", storage_state=str(storage_state))
+    else:
+        context = browser.new_context(service_workers="block")
+
+    context.route("**/*", _route_essential_only)
+    return context
+
+
+def release_context(context: BrowserContext) -> None:
+    """Release a context obtained from acquire_context, keeping its browser alive."""
+
+    session = _current_session()
+    # Persistent sessions only hand out their shared profile, which stays open;
+    # if it has already closed under us there are no pages left to close.
+    if session is not None and session.user_data_dir is not None:
+        for page in context.pages:
+            page.close()
+        return
+
+    context.close()
+
+
+def close_pool() -> None:
+    """Shut down the calling thread's pooled browser, if one is running."""
+
+    session = _current_session()
+    if session is None:
+        return
+
+    _LOCAL.session = None
+    try:
+        if session.persistent_context is not None:
+            session.persistent_context.close()
+        if session.browser is not None:
+            session.browser.close()
+    finally:
+        session.playwright.stop()
+
+
+atexit.register(close_pool)
@@ -2,21 +2,36 @@
 
 from __future__ import annotations
 
+import os
+import queue
 import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator
 
-from playwright.sync_api import sync_playwright
-
-from xmag.compiler import compile_tex_with_tectonic
+from xmag.browser_pool import acquire_context, close_pool, release_context
+from xmag.compiler import (
+    TectonicCompileError,
+    compile_project_with_tectonic,
+    compile_tex_with_tectonic,
+    find_tectonic,
+)
 from xmag.config import LayoutConfig, PaginationMode
 from xmag.extractor import ArticleExtractionError, extract_article
 from xmag.input import load_url_file
-from xmag.media import download_media
-from xmag.models import ArticleContent, BuildReport, LocalMedia
+from xmag.media import create_media_client, download_media
+from xmag.models import ArticleContent, ArticleInput, BuildReport, LocalMedia
 from xmag.renderer import render_issue_tex
 
+# Media downloads are network-bound and independent across articles. Each
+# article fans out to up to media._DOWNLOAD_WORKERS requests, so this pool can
+# queue more requests than the shared client has connections; the client waits
+# for a free connection (no pool timeout) rather than failing.
+_MEDIA_DOWNLOAD_WORKERS = 16
+
 
 @contextmanager
 def _build_workspace(output: Path, keep_tex: bool) -> Iterator[Path]:
@@ -30,6 +45,62 @@ def _build_workspace(output: Path, keep_tex: bool) -> Iterator[Path]:
         yield Path(tmp)
 
 
+def _extract_worker(
+    jobs: queue.SimpleQueue[tuple[int, ArticleInput]],
+    results: dict[int, ArticleContent],
+    errors: dict[int, ArticleExtractionError],
+    lock: threading.Lock,
+    stop: threading.Event,
+    *,
+    headless: bool,
+    storage_state: Path | None,
+    cdp_endpoint: str | None,
+    timeout_seconds: int,
+    continue_on_error: bool,
+    on_extracted: Callable[[ArticleContent], None] | None,
+    user_data_dir: Path | None,
+    release_browser: bool,
+) -> None:
+    try:
+        # Browsers are pooled per thread; every worker reuses one page across its jobs.
+        context = acquire_context(
+            headless=headless,
+            storage_state=storage_state,
+            cdp_endpoint=cdp_endpoint,
+            user_data_dir=user_data_dir,
+        )
+        try:
+            page = context.new_page()
+            while not stop.is_set():
+                try:
+                    index, item = jobs.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    content = extract_article(page, item, timeout_seconds)
+                except ArticleExtractionError as exc:
+                    with lock:
+                        errors[index] = exc
+                    if not continue_on_error:
+                        stop.set()
+                    continue
+
+                with lock:
+                    results[index] = content
+                if on_extracted is not None:
+                    on_extracted(content)
+        finally:
+            release_context(context)
+            if release_browser:
+                close_pool()
+    except BaseException:
+        # Any other failure aborts the build once re-raised; stop the remaining
+        # workers now instead of letting them drain the queue first.
+        stop.set()
+        raise
+
+
 def _extract_contents(
     *,
     url_file: Path,
@@ -37,33 +108,67 @@ def _extract_contents(
     storage_state: Path | None,
     timeout_seconds: int,
     continue_on_error: bool,
+    concurrency: int = 1,
+    cdp_endpoint: str | None = None,
+    on_extracted: Callable[[ArticleContent], None] | None = None,
+    browser_cache_dir: Path | None = None,
 ) -> tuple[list[ArticleContent], list[str], int]:
     inputs = load_url_file(url_file)
 
-    contents: list[ArticleContent] = []
-    failures: list[str] = []
+    jobs: queue.SimpleQueue[tuple[int, ArticleInput]] = queue.SimpleQueue()
+    for index, item in enumerate(inputs):
+        jobs.put((index, item))
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=headless)
-        if storage_state is not None:
-            context = browser.new_context(storage_state=str(storage_state))
-        else:
-            context = browser.new_context()
+    results: dict[int, ArticleContent] = {}
+    errors: dict[int, ArticleExtractionError] = {}
+    lock = threading.Lock()
+    stop = threading.Event()
 
-        page = context.new_page()
-        for item in inputs:
-            try:
-                content = extract_article(page, item, timeout_seconds)
-                contents.append(content)
-            except ArticleExtractionError as exc:
-                message = f"{item.url}: {exc}"
-                if continue_on_error:
-                    failures.append(message)
-                    continue
-                raise RuntimeError(message) from exc
+    run_worker = partial(
+        _extract_worker,
+        jobs,
+        results,
+        errors,
+        lock,
+        stop,
+        headless=headless,
+        storage_state=storage_state,
+        cdp_endpoint=cdp_endpoint,
+        timeout_seconds=timeout_seconds,
+        continue_on_error=continue_on_error,
+        on_extracted=on_extracted,
+    )
 
-        context.close()
-        browser.close()
+    def profile_dir(worker: int) -> Path | None:
+        # Chromium locks a profile directory, so every worker needs its own.
+        return browser_cache_dir / f"profile-{worker}" if browser_cache_dir is not None else None
+
+    workers = max(1, min(concurrency, len(inputs)))
+    if workers == 1:
+        # Run inline so the calling thread's pooled browser survives for the next build.
+        run_worker(user_data_dir=profile_dir(1), release_browser=False)
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="xmag-extract") as executor:
+            futures = [
+                executor.submit(run_worker, user_data_dir=profile_dir(worker), release_browser=True)
+                for worker in range(1, workers + 1)
+            ]
+            for future in futures:
+                future.result()
+
+    contents: list[ArticleContent] = []
+    failures: list[str] = []
+    for index, item in enumerate(inputs):
+        if index in results:
+            contents.append(results[index])
+            continue
+        if index not in errors:
+            continue
+
+        message = f"{item.url}: {errors[index]}"
+        if not continue_on_error:
+            raise RuntimeError(message) from errors[index]
+        failures.append(message)
 
     return contents, failures, len(inputs)
 
@@ -83,49 +188,117 @@ def build_issue(
     timeout_seconds: int = 30,
     continue_on_error: bool = False,
     keep_tex: bool = False,
+    concurrency: int = 1,
+    cdp_endpoint: str | None = None,
+    tectonic_cache_dir: Path | None = None,
+    tectonic_only_cached: bool = False,
+    browser_cache_dir: Path | None = None,
 ) -> BuildReport:
     """Build one or more PDFs from a list of X status URLs."""
 
-    contents, failures, total = _extract_contents(
-        url_file=url_file,
-        headless=headless,
-        storage_state=storage_state,
-        timeout_seconds=timeout_seconds,
-        continue_on_error=continue_on_error,
-    )
-
-    if not contents:
-        raise RuntimeError("No extractable articles were found")
+    # Fail on a missing Tectonic before spending time on extraction.
+    find_tectonic()
 
     output = output if output.suffix.lower() == ".pdf" else output.with_suffix(".pdf")
     output.parent.mkdir(parents=True, exist_ok=True)
 
-    report = BuildReport(total=total, succeeded=len(contents), failed=len(failures), failures=failures)
-
     with _build_workspace(output, keep_tex=keep_tex) as workspace:
-        media_map: dict[str, list[LocalMedia]] = {}
         media_root = workspace / "media"
-        for article in contents:
-            media_map[article.status_id] = download_media(
+        media_futures: dict[str, Future[list[LocalMedia]]] = {}
+        media_client = create_media_client()
+        media_executor = ThreadPoolExecutor(
+            max_workers=_MEDIA_DOWNLOAD_WORKERS, thread_name_prefix="xmag-media"
+        )
+
+        def schedule_media(article: ArticleContent) -> None:
+            # Start downloading as soon as an article is extracted so media I/O
+            # overlaps with the remaining page loads.
+            media_futures[article.status_id] = media_executor.submit(
+                download_media,
                 article.media_urls,
                 media_root / article.status_id,
+                client=media_client,
             )
 
+        try:
+            contents, failures, total = _extract_contents(
+                url_file=url_file,
+                headless=headless,
+                storage_state=storage_state,
+                timeout_seconds=timeout_seconds,
+                continue_on_error=continue_on_error,
+                concurrency=concurrency,
+                cdp_endpoint=cdp_endpoint,
+                on_extracted=schedule_media,
+                browser_cache_dir=browser_cache_dir,
+            )
+
+            if not contents:
+                raise RuntimeError("No extractable articles were found")
+
+            media_map: dict[str, list[LocalMedia]] = {
+                article.status_id: media_futures[article.status_id].result() for article in contents
+            }
+        finally:
+            media_executor.shutdown(cancel_futures=True)
+            media_client.close()
+
+        report = BuildReport(
+            total=total,
+            succeeded=len(contents),
+            failed=len(failures),
+            failures=failures,
+        )
+
         if config.pagination == PaginationMode.SPLIT:
+            source_dir = workspace / "src"
+            source_dir.mkdir(parents=True, exist_ok=True)
+
+            jobs: list[tuple[Path, Path]] = []
             for index, article in enumerate(contents, start=1):
                 single_tex = render_issue_tex([article], media_map, config.model_copy())
-                tex_path = workspace / f"article-{index:03d}-{article.status_id}.tex"
+                tex_path = source_dir / f"article-{index:03d}-{article.status_id}.tex"
                 tex_path.write_text(single_tex, encoding="utf-8")
+                jobs.append((tex_path, _split_output_path(output, index, article.status_id)))
 
-                article_output = _split_output_path(output, index, article.status_id)
-                compile_tex_with_tectonic(tex_path, article_output)
-                report.outputs.append(article_output)
+            try:
+                compile_project_with_tectonic(
+                    workspace,
+                    jobs,
+                    cache_dir=tectonic_cache_dir,
+                    only_cached=tectonic_only_cached,
+                )
+            except TectonicCompileError:
+                # Older Tectonic releases lack multi-output projects, and a batch
+                # failure hides which article broke; compile each article instead.
+                compile_workers = max(1, min(os.cpu_count() or 1, len(jobs)))
+                with ThreadPoolExecutor(
+                    max_workers=compile_workers, thread_name_prefix="xmag-compile"
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            compile_tex_with_tectonic,
+                            tex_path,
+                            article_output,
+                            cache_dir=tectonic_cache_dir,
+                            only_cached=tectonic_only_cached,
+                        )
+                        for tex_path, article_output in jobs
+                    ]
+                    for future in futures:
+                        future.result()
+            report.outputs.extend(article_output for _, article_output in jobs)
         else:
             tex = render_issue_tex(contents, media_map, config)
             tex_path = workspace / "issue.tex"
             tex_path.write_text(tex, encoding="utf-8")
 
-            compile_tex_with_tectonic(tex_path, output)
+            compile_tex_with_tectonic(
+                tex_path,
+                output,
+                cache_dir=tectonic_cache_dir,
+                only_cached=tectonic_only_cached,
+            )
             report.outputs.append(output)
 
     return report
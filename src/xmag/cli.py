@@ -7,7 +7,6 @@ from pathlib import Path
 import typer
 from pydantic import ValidationError
 
-from xmag.builder import build_issue
 from xmag.config import ImageLayoutMode, LayoutConfig, PaginationMode, PaperSize
 
 app = typer.Typer(help="Convert X article URLs into a three-column LaTeX-style PDF.", no_args_is_help=True)
@@ -38,6 +37,11 @@ def build(
     timeout_seconds: int = typer.Option(30, min=5, max=180),
     continue_on_error: bool = typer.Option(False),
     keep_tex: bool = typer.Option(False),
+    concurrency: int = typer.Option(1, min=1, max=16),
+    cdp_endpoint: str | None = typer.Option(None),
+    browser_cache_dir: Path | None = typer.Option(None, file_okay=False),
+    tectonic_cache_dir: Path | None = typer.Option(None, file_okay=False),
+    tectonic_only_cached: bool = typer.Option(False),
 ) -> None:
     """Build one or more magazine-style PDFs from X status URLs."""
 
@@ -59,6 +63,9 @@ def build(
         typer.echo(str(exc), err=True)
         raise typer.Exit(code=2) from exc
 
+    # Imported here so `--help` and option errors don't pay for loading Playwright.
+    from xmag.builder import build_issue
+
     try:
         report = build_issue(
             url_file=url_file,
@@ -69,6 +76,11 @@ def build(
             timeout_seconds=timeout_seconds,
             continue_on_error=continue_on_error,
             keep_tex=keep_tex,
+            concurrency=concurrency,
+            cdp_endpoint=cdp_endpoint,
+            browser_cache_dir=browser_cache_dir,
+            tectonic_cache_dir=tectonic_cache_dir,
+            tectonic_only_cached=tectonic_only_cached,
         )
     except Exception as exc:
         typer.echo(f"Build failed: {exc}", err=True)
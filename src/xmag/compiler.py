@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -11,22 +14,52 @@ class TectonicCompileError(RuntimeError):
     """Raised when Tectonic fails to compile a .tex file."""
 
 
-def compile_tex_with_tectonic(tex_path: Path, output_path: Path) -> None:
-    """Compile tex_path with tectonic and move PDF artifact to output_path."""
+# Bundle written by `tectonic -X new`; required by the Tectonic.toml schema.
+_TECTONIC_BUNDLE_URL = "https://relay.fullyjustified.net/default_bundle_v33.tar"
 
-    if shutil.which("tectonic") is None:
+
+@lru_cache(maxsize=1)
+def find_tectonic() -> str:
+    """Return the path of the tectonic executable, looked up once per process."""
+
+    path = shutil.which("tectonic")
+    if path is None:
         raise TectonicCompileError(
             "Tectonic not found. Install it and ensure `tectonic` is on PATH."
         )
+    return path
+
+
+def _tectonic_env(cache_dir: Path | None) -> dict[str, str] | None:
+    if cache_dir is None:
+        return None
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return {**os.environ, "TECTONIC_CACHE_DIR": str(cache_dir)}
+
+
+# Tectonic logs every fetched bundle file to stderr; only the end of the log is
+# kept for error messages.
+_STDERR_TAIL_LINES = 512
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    command = ["tectonic", "--outdir", str(output_path.parent), str(tex_path)]
-    process = subprocess.run(command, capture_output=True, text=True, check=False)
-    if process.returncode != 0:
-        raise TectonicCompileError(process.stderr.strip() or "Unknown Tectonic compile failure")
+def _run_tectonic(command: list[str], *, cwd: Path | None, env: dict[str, str] | None) -> None:
+    with subprocess.Popen(
+        command,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    ) as process:
+        tail: deque[str] = deque(process.stderr or (), maxlen=_STDERR_TAIL_LINES)
+        returncode = process.wait()
 
-    generated_pdf = output_path.parent / f"{tex_path.stem}.pdf"
+    if returncode != 0:
+        raise TectonicCompileError("".join(tail).strip() or "Unknown Tectonic compile failure")
+
+
+def _move_pdf(generated_pdf: Path, output_path: Path) -> None:
     if not generated_pdf.exists():
         raise TectonicCompileError(f"Expected output PDF not found: {generated_pdf}")
 
@@ -34,3 +67,70 @@ def compile_tex_with_tectonic(tex_path: Path, output_path: Path) -> None:
         if output_path.exists():
             output_path.unlink()
         generated_pdf.rename(output_path)
+
+
+def compile_tex_with_tectonic(
+    tex_path: Path,
+    output_path: Path,
+    *,
+    cache_dir: Path | None = None,
+    only_cached: bool = False,
+) -> None:
+    """Compile tex_path with tectonic and move PDF artifact to output_path.
+
+    cache_dir pins Tectonic's bundle cache (TECTONIC_CACHE_DIR) so repeated
+    builds share it; only_cached skips network checks against the bundle.
+    """
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    command = [find_tectonic(), "--outdir", str(output_path.parent), str(tex_path)]
+    if only_cached:
+        command.insert(1, "--only-cached")
+
+    _run_tectonic(command, cwd=None, env=_tectonic_env(cache_dir))
+
+    _move_pdf(output_path.parent / f"{tex_path.stem}.pdf", output_path)
+
+
+def compile_project_with_tectonic(
+    project_dir: Path,
+    jobs: list[tuple[Path, Path]],
+    *,
+    cache_dir: Path | None = None,
+    only_cached: bool = False,
+) -> None:
+    """Compile several documents with a single `tectonic -X build` run.
+
+    Each (tex_path, output_path) pair becomes one [[output]] of a generated
+    Tectonic.toml; tex files must live in project_dir / "src". Sharing one
+    process amortizes Tectonic's startup and bundle setup across documents.
+    """
+
+    tectonic = find_tectonic()
+
+    source_dir = project_dir / "src"
+    manifest = ["[doc]", 'name = "xmag"', f'bundle = "{_TECTONIC_BUNDLE_URL}"']
+    for tex_path, _ in jobs:
+        if tex_path.parent.resolve() != source_dir.resolve():
+            raise TectonicCompileError(f"Project input must live in {source_dir}: {tex_path}")
+        manifest.extend(
+            [
+                "",
+                "[[output]]",
+                f'name = "{tex_path.stem}"',
+                'type = "pdf"',
+                f'inputs = ["{tex_path.name}"]',
+            ]
+        )
+    (project_dir / "Tectonic.toml").write_text("\n".join(manifest) + "\n", encoding="utf-8")
+
+    command = [tectonic, "-X", "build"]
+    if only_cached:
+        command.append("--only-cached")
+
+    _run_tectonic(command, cwd=project_dir, env=_tectonic_env(cache_dir))
+
+    for tex_path, output_path in jobs:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _move_pdf(project_dir / "build" / tex_path.stem / f"{tex_path.stem}.pdf", output_path)
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
 
-from dateutil.parser import isoparse
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from xmag.models import ArticleContent, ArticleInput
@@ -33,67 +33,105 @@ _STOP_AT_LINE_RE = re.compile(
     re.IGNORECASE,
 )
 _TIMESTAMP_LINE_RE = re.compile(r"^\d{1,2}:\d{2}\s?(AM|PM)\s*·", re.IGNORECASE)
+# Finds the first line the loop in _sanitize_text would stop at, so replies and
+# recommendations below the article are dropped before the text is split.
+_STOP_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?:Want to publish your own Article\?|Upgrade to Premium|Read[^\S\n]+\d+[^\S\n]+replies"
+    r"|(?-i:Views|·))[^\S\n]*$"
+    r"|\d{1,2}:\d{2}[^\S\n]?(?:AM|PM)[^\S\n]*·)",
+    re.IGNORECASE | re.MULTILINE,
+)
+_HANDLE_RE = re.compile(r"@[A-Za-z0-9_]+")
+_TEXT_SELECTORS = (
+    '[data-testid="tweetText"]',
+    "div[lang]",
+    'div[dir="auto"]',
+)
+_PRIMARY_TEXT_SELECTOR = _TEXT_SELECTORS[0]
+_ARTICLE_SNAPSHOT_JS = """
+(article, selectors) => {
+  const candidates = {};
+  for (const selector of selectors) {
+    candidates[selector] = Array.from(article.querySelectorAll(selector))
+      .slice(0, 20)
+      .map((el) => el.innerText);
+  }
+  const author = article.querySelector('[data-testid="User-Name"]');
+  const time = article.querySelector("time");
+  return {
+    author: author ? author.innerText : "",
+    timestamp: time ? time.getAttribute("datetime") : null,
+    candidates,
+    media: Array.from(article.querySelectorAll('img[src*="twimg.com/media"]'))
+      .map((el) => el.getAttribute("src"))
+      .filter(Boolean),
+  };
+}
+"""
 _ARTIFACT_PATTERNS = [
     re.compile(r"if\s*\(!alreadyRequested\)\s*\{[\s\S]*?\}", re.IGNORECASE),
     re.compile(r"postComment\s*\([\s\S]*?\)", re.IGNORECASE),
     re.compile(r"@review-harness:[^\s]+", re.IGNORECASE),
     re.compile(r"\$\{trigger\}", re.IGNORECASE),
 ]
+_ARTIFACT_RE = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in _ARTIFACT_PATTERNS),
+    re.IGNORECASE,
+)
 
 
 def _to_datetime(raw_timestamp: str | None) -> datetime | None:
     if not raw_timestamp:
         return None
     try:
-        return isoparse(raw_timestamp)
+        # Python 3.11+ parses the Z-suffixed ISO-8601 values X emits natively.
+        return datetime.fromisoformat(raw_timestamp)
     except ValueError:
         return None
 
 
-def _dedupe_preserve(items: list[str]) -> list[str]:
-    seen: set[str] = set()
-    result: list[str] = []
-    for item in items:
-        if item in seen:
-            continue
-        seen.add(item)
-        result.append(item)
-    return result
-
-
 def _extract_author(raw_author: str) -> tuple[str, str]:
     lines = [line.strip() for line in raw_author.splitlines() if line.strip()]
 
-    match = re.search(r"@[A-Za-z0-9_]+", raw_author)
+    match = _HANDLE_RE.search(raw_author)
     author_handle = match.group(0) if match else "@unknown"
 
     candidate_name = lines[0] if lines else "Unknown"
-    candidate_name = re.sub(r"@[A-Za-z0-9_]+", "", candidate_name).strip(" -|·")
+    candidate_name = _HANDLE_RE.sub("", candidate_name).strip(" -|·")
     author_name = candidate_name if candidate_name else "Unknown"
     return author_name, author_handle
 
 
-def _sanitize_text(raw_text: str, author_name: str, author_handle: str) -> str:
-    sanitized_source = raw_text
-    for pattern in _ARTIFACT_PATTERNS:
-        sanitized_source = pattern.sub(" ", sanitized_source)
-
-    author_prefix = re.compile(
+@lru_cache(maxsize=256)
+def _author_prefix_re(author_name: str, author_handle: str) -> re.Pattern[str]:
+    return re.compile(
         rf"^\s*{re.escape(author_name)}\s+{re.escape(author_handle)}(?:\s+[\d.,]+(?:[KMBT])?)*\s+",
         re.IGNORECASE,
     )
-    sanitized_source = author_prefix.sub("", sanitized_source)
 
-    lines = [line.rstrip() for line in sanitized_source.splitlines()]
-    cleaned: list[str] = []
+
+def _sanitize_text(raw_text: str, author_name: str, author_handle: str) -> str:
+    sanitized_source = _ARTIFACT_RE.sub(" ", raw_text)
+    sanitized_source = _author_prefix_re(author_name, author_handle).sub("", sanitized_source)
+    stop = _STOP_RE.search(sanitized_source)
+    if stop is not None:
+        sanitized_source = sanitized_source[: stop.start()]
 
     author_name_norm = author_name.strip().lower()
     author_handle_norm = author_handle.strip().lower()
+    author_line_norm = f"{author_name_norm} {author_handle_norm}".strip()
 
-    for line in lines:
+    kept: list[str] = []
+    previous_blank = False
+
+    for line in sanitized_source.splitlines():
         stripped = line.strip()
         if not stripped:
-            cleaned.append("")
+            # Collapse repeated blank lines but preserve paragraph intent.
+            if not previous_blank:
+                kept.append("")
+                previous_blank = True
             continue
 
         if _STOP_AT_LINE_RE.match(stripped) or _TIMESTAMP_LINE_RE.match(stripped):
@@ -103,68 +141,52 @@ def _sanitize_text(raw_text: str, author_name: str, author_handle: str) -> str:
             break
 
         lower = stripped.lower()
-        if (
-            lower == author_name_norm
-            or lower == author_handle_norm
-            or lower == f"{author_name_norm} {author_handle_norm}".strip()
-        ):
+        if lower == author_name_norm or lower == author_handle_norm or lower == author_line_norm:
             continue
 
         if _METRIC_LINE_RE.fullmatch(stripped):
             continue
 
-        cleaned.append(stripped)
-
-    # Collapse repeated blank lines but preserve paragraph intent.
-    collapsed: list[str] = []
-    previous_blank = False
-    for line in cleaned:
-        is_blank = line == ""
-        if is_blank and previous_blank:
-            continue
-        collapsed.append(line)
-        previous_blank = is_blank
-
-    return "\n".join(collapsed).strip()
+        kept.append(stripped)
+        previous_blank = False
 
+    return "\n".join(kept).strip()
 
-def _extract_text_from_locator(article_locator: "Locator", author_name: str, author_handle: str) -> str:
-    selector_candidates = [
-        '[data-testid="tweetText"]',
-        "div[lang]",
-        'div[dir="auto"]',
-    ]
 
+def _select_text(
+    candidates: dict[str, list[str]],
+    read_fallback_text: Callable[[], str],
+    author_name: str,
+    author_handle: str,
+) -> str:
     best_sanitized = ""
 
-    for selector in selector_candidates:
-        nodes = article_locator.locator(selector)
-        if nodes.count() == 0:
-            continue
-
+    for selector in _TEXT_SELECTORS:
         collected: list[str] = []
-        for index in range(min(nodes.count(), 20)):
-            candidate = nodes.nth(index).inner_text().strip()
+        for raw_candidate in candidates.get(selector, []):
+            candidate = raw_candidate.strip()
             if candidate and len(candidate) >= 12:
                 collected.append(candidate)
 
         if not collected:
             continue
 
-        if selector == '[data-testid="tweetText"]':
-            candidate_text = "\n\n".join(_dedupe_preserve(collected))
+        if selector == _PRIMARY_TEXT_SELECTOR:
+            candidate_text = "\n\n".join(dict.fromkeys(collected))
         else:
             candidate_text = max(collected, key=len)
 
         sanitized = _sanitize_text(candidate_text, author_name, author_handle)
         if sanitized:
-            if selector == '[data-testid="tweetText"]' and len(sanitized) >= 40:
+            if selector == _PRIMARY_TEXT_SELECTOR and len(sanitized) >= 40:
                 return sanitized
             if len(sanitized) > len(best_sanitized):
                 best_sanitized = sanitized
 
+    # Reading the whole article's innerText is only worth it when the
+    # primary selector did not already produce a usable body.
     try:
-        fallback_inner_text = article_locator.inner_text().strip()
+        fallback_inner_text = read_fallback_text().strip()
     except Exception:
         fallback_inner_text = ""
 
@@ -192,12 +214,16 @@ def _find_article_locator(page: "Page", status_id: str, timeout_ms: int) -> "Loc
     raise ArticleNotFoundError(f"Could not locate article for status id {status_id}")
 
 
-def _extract_media_urls(article_locator: "Locator") -> list[str]:
-    urls = article_locator.locator('img[src*="twimg.com/media"]').evaluate_all(
-        "els => els.map(el => el.getAttribute('src')).filter(Boolean)"
-    )
-    cleaned = [url for url in urls if isinstance(url, str) and url.startswith("http")]
-    return _dedupe_preserve(cleaned)
+def _extract_media_urls(raw_urls: list[object]) -> list[str]:
+    cleaned = [url for url in raw_urls if isinstance(url, str) and url.startswith("http")]
+    return list(dict.fromkeys(cleaned))
+
+
+def _snapshot_article(article_locator: "Locator") -> dict[str, Any]:
+    snapshot = article_locator.evaluate(_ARTICLE_SNAPSHOT_JS, list(_TEXT_SELECTORS))
+    if not isinstance(snapshot, dict):
+        raise ArticleExtractionError("Article snapshot returned unexpected data")
+    return snapshot
 
 
 def extract_article(
@@ -212,29 +238,30 @@ def extract_article(
     timeout_ms = timeout_s * 1000
 
     try:
-        page.goto(article.url, wait_until="domcontentloaded", timeout=timeout_ms)
+        # The article selector wait below is the real gate; don't also block on DOM parsing.
+        page.goto(article.url, wait_until="commit", timeout=timeout_ms)
         article_locator = _find_article_locator(page, article.status_id, timeout_ms)
 
-        raw_author = ""
-        author_nodes = article_locator.locator('[data-testid="User-Name"]')
-        if author_nodes.count() > 0:
-            raw_author = author_nodes.first.inner_text().strip()
-        author_name, author_handle = _extract_author(raw_author)
+        # One round-trip into the page instead of one per locator query.
+        snapshot = _snapshot_article(article_locator)
 
-        raw_timestamp = None
-        time_nodes = article_locator.locator("time")
-        if time_nodes.count() > 0:
-            raw_timestamp = time_nodes.first.get_attribute("datetime")
+        author_name, author_handle = _extract_author(str(snapshot.get("author") or "").strip())
+        raw_timestamp = snapshot.get("timestamp")
 
-        text = _extract_text_from_locator(article_locator, author_name, author_handle)
-        media_urls = _extract_media_urls(article_locator)
+        text = _select_text(
+            snapshot.get("candidates") or {},
+            article_locator.inner_text,
+            author_name,
+            author_handle,
+        )
+        media_urls = _extract_media_urls(snapshot.get("media") or [])
 
         return ArticleContent(
             status_id=article.status_id,
             url=article.url,
             author_name=author_name,
             author_handle=author_handle,
-            published_at=_to_datetime(raw_timestamp),
+            published_at=_to_datetime(raw_timestamp if isinstance(raw_timestamp, str) else None),
             text=text,
             media_urls=media_urls,
         )
@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from urllib.parse import urlparse
 
 from xmag.models import ArticleInput
 
 _ALLOWED_HOSTS = {"x.com", "www.x.com", "twitter.com", "www.twitter.com"}
+# Scheme and host are case-insensitive, as in the urlparse fallback; the path is
+# matched case-sensitively, like its `part == "status"` check. A user segment
+# named "status" is left to the fallback, which reads the id after the first one.
+_STATUS_URL_RE = re.compile(
+    r"^(?i:https?://(?:www\.)?(?:x|twitter)\.com)/(?!status/)[^/?#]+/status/(\d+)(?:[/?#]|$)"
+)
 
 
 def parse_status_id(url: str) -> str:
     """Extract a numeric status id from an X/Twitter URL."""
 
+    match = _STATUS_URL_RE.match(url.strip())
+    if match:
+        return match.group(1)
+    return _parse_status_id_slow(url)
+
+
+def _parse_status_id_slow(url: str) -> str:
+    # Full parse for URLs outside the common shape; yields specific error messages.
     parsed = urlparse(url.strip())
     if parsed.scheme not in {"http", "https"}:
         raise ValueError(f"Unsupported URL scheme in '{url}'")
@@ -39,21 +54,22 @@ def load_url_file(path: Path) -> list[ArticleInput]:
     seen: set[str] = set()
     items: list[ArticleInput] = []
 
-    for line_number, raw_line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
+    with path.open("r", encoding="utf-8") as handle:
+        for line_number, raw_line in enumerate(handle, start=1):
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
 
-        try:
-            status_id = parse_status_id(line)
-        except ValueError as exc:
-            raise ValueError(f"Invalid URL at line {line_number}: {exc}") from exc
+            try:
+                status_id = parse_status_id(line)
+            except ValueError as exc:
+                raise ValueError(f"Invalid URL at line {line_number}: {exc}") from exc
 
-        if status_id in seen:
-            continue
+            if status_id in seen:
+                continue
 
-        seen.add(status_id)
-        items.append(ArticleInput(url=line, status_id=status_id))
+            seen.add(status_id)
+            items.append(ArticleInput(url=line, status_id=status_id))
 
     if not items:
         raise ValueError("No valid URLs found in URL file")
@@ -3,76 +3,136 @@
 from __future__ import annotations
 
 import re
-from pathlib import Path
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path, PurePosixPath
+from urllib.parse import ParseResult, parse_qs, urlencode, urlparse, urlunparse
 
 import httpx
 
 from xmag.models import LocalMedia
 
+# Matches URLs that normalize_media_url would return unchanged, so they can skip
+# parsing entirely: lowercase http(s), a host, no params/fragment/whitespace, and
+# a query that is exactly format=<alphanumeric>&name=orig.
+_CANONICAL_MEDIA_URL_RE = re.compile(
+    r"https?://[^\s/?#;]+/[^\s?#;]*\?format=[A-Za-z0-9]+&name=orig"
+)
+
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
 
 class MediaDownloadError(RuntimeError):
     """Raised when media assets fail to download."""
 
 
+# Upper bound on concurrent requests for a single article's images. Callers
+# sharing a client across articles are capped by its connection limit instead.
+_DOWNLOAD_WORKERS = 8
+_CHUNK_SIZE = 64 * 1024
+
+
 def _dedupe_preserve(items: list[str]) -> list[str]:
-    seen: set[str] = set()
-    result: list[str] = []
-    for item in items:
-        if item in seen:
-            continue
-        seen.add(item)
-        result.append(item)
-    return result
+    return list(dict.fromkeys(items))
+
+
+@lru_cache(maxsize=1024)
+def _parse_media_url(url: str) -> tuple[ParseResult, str]:
+    # Each URL is parsed by normalize_media_url and again, once normalized, by
+    # _filename_for_media; cache the parse and the raw `format` parameter.
+    parsed = urlparse(url)
+    return parsed, parse_qs(parsed.query).get("format", [""])[0]
+
+
+@lru_cache(maxsize=16)
+def _orig_query(image_format: str) -> str:
+    return urlencode({"format": image_format, "name": "orig"})
 
 
 def normalize_media_url(url: str) -> str:
     """Normalize X media URLs to request original quality image assets."""
 
-    parsed = urlparse(url)
-    query = parse_qs(parsed.query)
+    if _CANONICAL_MEDIA_URL_RE.fullmatch(url):
+        return url
 
-    image_format = query.get("format", [""])[0]
+    parsed, image_format = _parse_media_url(url)
     if not image_format:
-        suffix = Path(parsed.path).suffix.lstrip(".")
+        suffix = PurePosixPath(parsed.path).suffix.lstrip(".")
         image_format = suffix if suffix else "jpg"
 
-    normalized_query = urlencode({"format": image_format, "name": "orig"})
+    normalized_query = _orig_query(image_format)
+    # Already canonical: rebuilding it would produce the same string.
+    canonical = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{normalized_query}"
+    if parsed.netloc and url == canonical:
+        return url
     return urlunparse((parsed.scheme, parsed.netloc, parsed.path, "", normalized_query, ""))
 
 
 def _filename_for_media(url: str, index: int) -> str:
-    parsed = urlparse(url)
-    query = parse_qs(parsed.query)
-
-    image_format = query.get("format", [""])[0]
-    stem = Path(parsed.path).stem or f"image_{index:03d}"
-    safe_stem = re.sub(r"[^A-Za-z0-9._-]+", "_", stem)
+    parsed, image_format = _parse_media_url(url)
+    stem = PurePosixPath(parsed.path).stem or f"image_{index:03d}"
+    safe_stem = _UNSAFE_FILENAME_RE.sub("_", stem)
 
     extension = image_format if image_format else "jpg"
     return f"{index:03d}_{safe_stem}.{extension}"
 
 
-def download_media(media_urls: list[str], out_dir: Path) -> list[LocalMedia]:
-    """Download media URLs into out_dir and return local media metadata."""
+def create_media_client() -> httpx.Client:
+    """Create an HTTP client suitable for sharing across download_media calls."""
 
-    out_dir.mkdir(parents=True, exist_ok=True)
+    return httpx.Client(
+        # Concurrent download_media calls can queue more requests than there are
+        # connections; waiting for a free one is not a failure, so only the
+        # network phases are timed.
+        timeout=httpx.Timeout(20.0, pool=None),
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
 
-    normalized_urls = [normalize_media_url(url) for url in _dedupe_preserve(media_urls)]
-    local_media: list[LocalMedia] = []
 
-    with httpx.Client(timeout=20.0, follow_redirects=True) as client:
-        for index, url in enumerate(normalized_urls, start=1):
-            filename = _filename_for_media(url, index)
-            file_path = out_dir / filename
+def _download_one(client: httpx.Client, url: str, file_path: Path) -> LocalMedia:
+    try:
+        # Stream to disk so full-size originals are never held in memory.
+        with client.stream("GET", url) as response:
+            response.raise_for_status()
+            with file_path.open("wb") as handle:
+                for chunk in response.iter_bytes(chunk_size=_CHUNK_SIZE):
+                    handle.write(chunk)
+    except httpx.HTTPError as exc:
+        file_path.unlink(missing_ok=True)
+        raise MediaDownloadError(f"Failed to download media '{url}': {exc}") from exc
+
+    return LocalMedia(source_url=url, local_path=file_path)
 
-            try:
-                response = client.get(url)
-                response.raise_for_status()
-            except httpx.HTTPError as exc:
-                raise MediaDownloadError(f"Failed to download media '{url}': {exc}") from exc
 
-            file_path.write_bytes(response.content)
-            local_media.append(LocalMedia(source_url=url, local_path=file_path))
+def download_media(
+    media_urls: list[str],
+    out_dir: Path,
+    *,
+    client: httpx.Client | None = None,
+) -> list[LocalMedia]:
+    """Download media URLs into out_dir and return local media metadata.
 
-    return local_media
+    Pass a shared client to reuse pooled keep-alive connections across calls.
+    """
+
+    if client is None:
+        with create_media_client() as owned_client:
+            return download_media(media_urls, out_dir, client=owned_client)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    normalized_urls = [normalize_media_url(url) for url in _dedupe_preserve(media_urls)]
+    file_paths = [
+        out_dir / _filename_for_media(url, index)
+        for index, url in enumerate(normalized_urls, start=1)
+    ]
+    download = partial(_download_one, client)
+
+    if len(normalized_urls) <= 1:
+        return list(map(download, normalized_urls, file_paths))
+
+    workers = min(_DOWNLOAD_WORKERS, len(normalized_urls))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="xmag-download") as executor:
+        # map() yields in submission order, so local media keeps the article's order.
+        return list(executor.map(download, normalized_urls, file_paths))
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import io
 import re
-from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from importlib.resources import files
 from pathlib import Path
+from typing import Iterator, NamedTuple
 from urllib.parse import urlparse
 
-from jinja2 import Environment
+from jinja2 import Environment, Template
 
 from xmag.config import ImageLayoutMode, LayoutConfig, PaperSize, PaginationMode
 from xmag.models import ArticleContent, LocalMedia
@@ -26,23 +28,85 @@ _LATEX_ESCAPE_MAP = {
     "~": r"\textasciitilde{}",
     "^": r"\textasciicircum{}",
 }
+_LATEX_SPECIAL_RE = re.compile(f"[{re.escape(''.join(_LATEX_ESCAPE_MAP))}]")
 
-_CODE_FENCE_RE = re.compile(r"```(?P<lang>[A-Za-z0-9_+-]*)\n(?P<code>[\s\S]*?)```", re.MULTILINE)
-_ULIST_RE = re.compile(r"^[-*]\s+")
+# hyperref reads \href URLs verbatim only outside other commands' arguments;
+# escaped forms of these are mapped back to the plain characters either way.
+_HREF_SPECIAL_RE = re.compile(r"[%#]")
+
+_CODE_FENCE = "```"
+_FENCE_LANGUAGE_RE = re.compile(r"[A-Za-z0-9_+-]*\n")
 _OLIST_RE = re.compile(r"^\d+[.)]\s+")
 _HEADING_RE = re.compile(r"^(#{1,3})\s+(.*)$")
+_HEADING_MARKER_RE = re.compile(r"^#{1,3}\s+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n{2,}")
 _TITLE_HEADING_RE = re.compile(r"^(chapter\s+\d+[:.]|conclusion$|appendix[:.]?)", re.IGNORECASE)
-_COMMAND_LINE_RE = re.compile(
-    r"^(?:\$|npm\s+|pnpm\s+|yarn\s+|uv\s+|python\s+|pip\s+|git\s+|npx\s+|node\s+|curl\s+|bash\s+|sh\s+|export\s+|set\s+)",
-    re.IGNORECASE,
-)
-_INLINE_MARKUP_RE = re.compile(
-    r"\[([^\]]+)\]\((https?://[^)\s]+)\)|\*\*([^*]+)\*\*|`([^`]+)`|\*([^*]+)\*"
+# Shell-like lines start with "$" or one of these words followed by whitespace.
+_COMMAND_WORDS = frozenset(
+    {
+        "npm",
+        "pnpm",
+        "yarn",
+        "uv",
+        "python",
+        "pip",
+        "git",
+        "npx",
+        "node",
+        "curl",
+        "bash",
+        "sh",
+        "export",
+        "set",
+    }
 )
 
 
-@dataclass(frozen=True)
-class RenderBlock:
+def _inline_token_re(excluded: str = "") -> re.Pattern[str]:
+    # Single-pass inline tokenizer: every character belongs to exactly one token
+    # and the token kind is read from the outer group that matched. Markup can
+    # only start at "[", "*" or "`", so anything else is one plain run.
+    # Characters in `excluded` never appear inside markup.
+    return re.compile(
+        rf"(?P<link>\[(?P<link_text>[^\]{excluded}]+)\]\((?P<link_url>https?://[^)\s]+)\))"
+        rf"|(?P<bold>\*\*(?P<bold_text>[^*{excluded}]+)\*\*)"
+        rf"|(?P<code>`(?P<code_text>[^`{excluded}]+)`)"
+        rf"|(?P<italic>\*(?P<italic_text>[^*{excluded}]+)\*)"
+        r"|(?P<plain>[^[*`]+|[\s\S])"
+    )
+
+
+_INLINE_TOKEN_RE = _inline_token_re()
+# Lets several stripped lines be rendered in one pass when joined with "\n".
+_INLINE_LINES_TOKEN_RE = _inline_token_re(r"\n")
+
+# Fence languages that listings can highlight, mapped to their rendered option.
+_LISTINGS_LANGUAGES = {
+    "py": "Python",
+    "python": "Python",
+    "js": "Java",
+    "javascript": "Java",
+    "ts": "Java",
+    "typescript": "Java",
+    "json": "",
+    "bash": "",
+    "sh": "",
+}
+_LISTINGS_OPTION = {
+    token: f"[language={name}]" if name else "" for token, name in _LISTINGS_LANGUAGES.items()
+}
+
+
+@lru_cache(maxsize=1)
+def _issue_template() -> Template:
+    # The template never changes at runtime: load and compile it on first render.
+    environment = Environment(autoescape=False, trim_blocks=True, lstrip_blocks=True)
+    source = files("xmag.templates").joinpath("issue.tex.j2").read_text(encoding="utf-8")
+    return environment.from_string(source)
+
+
+class RenderBlock(NamedTuple):
     """Intermediate content block before LaTeX serialization."""
 
     kind: str
@@ -50,54 +114,123 @@ class RenderBlock:
     language: str | None = None
 
 
+def _latex_replacement(match: re.Match[str]) -> str:
+    return _LATEX_ESCAPE_MAP[match.group()]
+
+
 def latex_escape(value: str) -> str:
     """Escape LaTeX special characters in user/content text."""
 
-    return "".join(_LATEX_ESCAPE_MAP.get(char, char) for char in value)
+    # str.translate falls back to a slow per-character path once a mapping
+    # expands to several characters; substituting only the matches is cheaper
+    # unless nearly every character needs escaping.
+    return _LATEX_SPECIAL_RE.sub(_latex_replacement, value)
 
 
-def _render_inline_markup(value: str) -> str:
-    rendered: list[str] = []
-    cursor = 0
+def _href_url(url: str) -> str:
+    # Most URLs carry neither character, so they are returned without a rewrite.
+    if _HREF_SPECIAL_RE.search(url) is None:
+        return url
+    return _HREF_SPECIAL_RE.sub(r"\\\g<0>", url)
+
+
+def _render_inline_markup(value: str, token_re: re.Pattern[str] = _INLINE_TOKEN_RE) -> str:
+    # Texts that need escaping are left raw in `parts` and their positions noted;
+    # they are then escaped in one latex_escape call, joined and split back on a
+    # NUL separator the escape map never produces. Text that already contains
+    # NUL is escaped piece by piece instead.
+    parts: list[str] = []
+    slots: list[int] = []
+
+    for match in token_re.finditer(value):
+        kind = match.lastgroup
+        if kind == "plain":
+            slots.append(len(parts))
+            parts.append(match.group())
+            continue
+
+        if kind == "link":
+            parts.append(rf"\href{{{_href_url(match.group('link_url'))}}}{{")
+            text = match.group("link_text")
+        elif kind == "bold":
+            parts.append(r"\textbf{")
+            text = match.group("bold_text")
+        elif kind == "code":
+            parts.append(r"\texttt{")
+            text = match.group("code_text")
+        else:
+            parts.append(r"\emph{")
+            text = match.group("italic_text")
+        slots.append(len(parts))
+        parts.append(text)
+        parts.append("}")
+
+    raw_texts = [parts[slot] for slot in slots]
+    if "\x00" in value:
+        escaped = [latex_escape(text) for text in raw_texts]
+    else:
+        escaped = latex_escape("\x00".join(raw_texts)).split("\x00")
+    for slot, text in zip(slots, escaped):
+        parts[slot] = text
+
+    return "".join(parts)
+
+
+def _render_inline_lines(lines: list[str]) -> list[str]:
+    # Stripped lines never contain "\n" and rendering never adds one, so the
+    # joined text splits back into exactly one rendered entry per line.
+    if not lines:
+        return []
+    return _render_inline_markup("\n".join(lines), _INLINE_LINES_TOKEN_RE).split("\n")
+
 
-    for match in _INLINE_MARKUP_RE.finditer(value):
-        rendered.append(latex_escape(value[cursor : match.start()]))
+# Block classification peeks at a stripped line's first character before any
+# regex runs; most prose lines are rejected without touching the regex engine.
+def _is_command_line(line: str) -> bool:
+    if line.startswith("$"):
+        return True
+    parts = line.split(None, 1)
+    return len(parts) == 2 and parts[0].lower() in _COMMAND_WORDS
 
-        link_text = match.group(1)
-        link_url = match.group(2)
-        bold_text = match.group(3)
-        code_text = match.group(4)
-        italic_text = match.group(5)
 
-        if link_text is not None and link_url is not None:
-            rendered.append(rf"\href{{{link_url}}}{{{latex_escape(link_text)}}}")
-        elif bold_text is not None:
-            rendered.append(rf"\textbf{{{latex_escape(bold_text)}}}")
-        elif code_text is not None:
-            rendered.append(rf"\texttt{{{latex_escape(code_text)}}}")
-        elif italic_text is not None:
-            rendered.append(rf"\emph{{{latex_escape(italic_text)}}}")
+def _is_unordered_item(line: str) -> bool:
+    return line[:1] in ("-", "*") and line[1:2].isspace()
 
-        cursor = match.end()
 
-    rendered.append(latex_escape(value[cursor:]))
-    return "".join(rendered)
+def _is_ordered_item(line: str) -> bool:
+    return line[:1].isdigit() and _OLIST_RE.match(line) is not None
 
 
+@lru_cache(maxsize=4)
 def _paper_option(paper: PaperSize) -> str:
     if paper == PaperSize.A4:
         return "a4paper"
     return "letterpaper"
 
 
+@lru_cache(maxsize=1024)
+def _format_date(wall_time: datetime, tzname: str | None) -> str:
+    base = wall_time.strftime("%Y-%m-%d %H:%M:%S")
+    return f"{base} {tzname}" if tzname else base
+
+
 def _date_display(value: datetime | None) -> str:
     if value is None:
         return "Unknown"
-    return value.strftime("%Y-%m-%d %H:%M:%S %Z").strip()
+    # Aware datetimes compare equal across time zones, so the cache is keyed on
+    # the displayed wall time and zone name rather than on the datetime itself.
+    return _format_date(value.replace(tzinfo=None), value.tzname())
+
+
+@lru_cache(maxsize=2048)
+def _resolved_latex_path(path: Path) -> str:
+    # as_posix() only rewrites separators on Windows; POSIX paths come back as-is.
+    return path.resolve().as_posix()
 
 
 def _latex_path(path: Path) -> str:
-    return str(path.resolve()).replace("\\", "/")
+    # Anchor relative paths first so a cached entry never outlives a chdir.
+    return _resolved_latex_path(path if path.is_absolute() else Path.cwd() / path)
 
 
 def _article_label(status_id: str) -> str:
@@ -109,27 +242,40 @@ def _article_index_title(article: ArticleContent) -> str:
         stripped = line.strip()
         if not stripped:
             continue
-        stripped = re.sub(r"^#{1,3}\s+", "", stripped)
-        compact = re.sub(r"\s+", " ", stripped)
+        stripped = _HEADING_MARKER_RE.sub("", stripped)
+        compact = _WHITESPACE_RE.sub(" ", stripped)
         if len(compact) > 120:
             return f"{compact[:117]}..."
         return compact
     return "Untitled"
 
 
+def _split_paragraphs(text: str) -> list[str]:
+    # Paragraph breaks are almost always exactly one blank line, which a plain
+    # str.split handles; longer runs of newlines need the regex.
+    if "\n\n\n" in text:
+        return _PARAGRAPH_BREAK_RE.split(text)
+    return text.split("\n\n")
+
+
 def _expand_paragraph_chunks(segment: str) -> list[str]:
     stripped_segment = segment.strip("\n")
     if not stripped_segment:
         return []
 
     if "\n\n" in stripped_segment:
-        base_chunks = [chunk.strip("\n") for chunk in re.split(r"\n{2,}", stripped_segment) if chunk.strip()]
+        # isspace() tests for content without building a stripped copy to discard.
+        base_chunks = [
+            chunk.strip("\n")
+            for chunk in _split_paragraphs(stripped_segment)
+            if chunk and not chunk.isspace()
+        ]
     else:
         base_chunks = [stripped_segment]
 
     expanded_chunks: list[str] = []
     for chunk in base_chunks:
-        lines = [line.strip() for line in chunk.splitlines() if line.strip()]
+        lines = [stripped for line in chunk.splitlines() if (stripped := line.strip())]
         if len(lines) <= 1:
             expanded_chunks.extend(lines or [chunk.strip()])
             continue
@@ -144,105 +290,100 @@ def _expand_paragraph_chunks(segment: str) -> list[str]:
     return [chunk for chunk in expanded_chunks if chunk]
 
 
-def _parse_plain_text_segment(segment: str) -> list[RenderBlock]:
-    blocks: list[RenderBlock] = []
-    paragraph_chunks = _expand_paragraph_chunks(segment)
-
-    for chunk in paragraph_chunks:
-        lines = [line.strip() for line in chunk.splitlines() if line.strip()]
+def _iter_plain_text_blocks(segment: str) -> Iterator[RenderBlock]:
+    for chunk in _expand_paragraph_chunks(segment):
+        lines = [stripped for line in chunk.splitlines() if (stripped := line.strip())]
         if not lines:
             continue
 
-        if len(lines) == 1:
+        if len(lines) == 1 and lines[0].startswith("#"):
             heading_match = _HEADING_RE.match(lines[0])
             if heading_match and heading_match.group(2).strip():
                 level = len(heading_match.group(1))
-                blocks.append(
-                    RenderBlock(kind="heading", body=heading_match.group(2).strip(), language=str(level))
+                yield RenderBlock(
+                    kind="heading", body=heading_match.group(2).strip(), language=str(level)
                 )
                 continue
 
         if len(lines) == 1:
             line = lines[0]
             if _TITLE_HEADING_RE.match(line) or (line.isupper() and 3 <= len(line) <= 90):
-                blocks.append(RenderBlock(kind="heading", body=line, language="2"))
+                yield RenderBlock(kind="heading", body=line, language="2")
                 continue
 
-        command_like_count = sum(1 for line in lines if _COMMAND_LINE_RE.match(line))
+        command_like_count = sum(1 for line in lines if _is_command_line(line))
         if command_like_count >= 2:
-            blocks.append(RenderBlock(kind="code", body="\n".join(lines), language=None))
+            yield RenderBlock(kind="code", body="\n".join(lines), language=None)
             continue
 
-        if all(_ULIST_RE.match(line) for line in lines):
-            items = [re.sub(_ULIST_RE, "", line, count=1).strip() for line in lines]
-            blocks.append(RenderBlock(kind="ulist", body="\n".join(items)))
+        if all(_is_unordered_item(line) for line in lines):
+            items = [line[1:].strip() for line in lines]
+            yield RenderBlock(kind="ulist", body="\n".join(items))
             continue
 
-        if all(_OLIST_RE.match(line) for line in lines):
-            items = [re.sub(_OLIST_RE, "", line, count=1).strip() for line in lines]
-            blocks.append(RenderBlock(kind="olist", body="\n".join(items)))
+        if all(_is_ordered_item(line) for line in lines):
+            items = [_OLIST_RE.sub("", line, count=1).strip() for line in lines]
+            yield RenderBlock(kind="olist", body="\n".join(items))
             continue
 
-        blocks.append(RenderBlock(kind="text", body="\n".join(lines)))
-
-    return blocks
+        yield RenderBlock(kind="text", body="\n".join(lines))
 
 
-def _parse_content_blocks(text: str) -> list[RenderBlock]:
-    normalized = text.replace("\r\n", "\n").strip()
-    if not normalized:
-        return []
-
-    blocks: list[RenderBlock] = []
+def _iter_code_fences(text: str) -> Iterator[tuple[int, int, str, str]]:
+    # Yields (start, end, language, code) per closed fence with a linear str.find
+    # scan. Once no closing fence remains, no later opener can close either, so
+    # the scan stops instead of retrying from every remaining position.
     cursor = 0
+    while (start := text.find(_CODE_FENCE, cursor)) != -1:
+        opener = _FENCE_LANGUAGE_RE.match(text, start + len(_CODE_FENCE))
+        if opener is None:
+            cursor = start + 1
+            continue
 
-    for match in _CODE_FENCE_RE.finditer(normalized):
-        leading_text = normalized[cursor : match.start()]
-        blocks.extend(_parse_plain_text_segment(leading_text))
+        close = text.find(_CODE_FENCE, opener.end())
+        if close == -1:
+            return
 
-        language = match.group("lang").strip() or None
-        code = match.group("code").strip("\n")
-        if code:
-            blocks.append(RenderBlock(kind="code", body=code, language=language))
+        end = close + len(_CODE_FENCE)
+        yield start, end, opener.group()[:-1], text[opener.end() : close]
+        cursor = end
 
-        cursor = match.end()
 
-    trailing_text = normalized[cursor:]
-    blocks.extend(_parse_plain_text_segment(trailing_text))
+def _iter_content_blocks(text: str) -> Iterator[RenderBlock]:
+    # Blocks are yielded as they are parsed so rendering never holds the whole list.
+    normalized = text.replace("\r\n", "\n").strip()
+    if not normalized:
+        return
 
-    if not blocks:
-        blocks.append(RenderBlock(kind="text", body=normalized))
+    emitted = False
+    cursor = 0
 
-    return blocks
+    for start, end, language, code in _iter_code_fences(normalized):
+        for block in _iter_plain_text_blocks(normalized[cursor:start]):
+            emitted = True
+            yield block
 
+        code = code.strip("\n")
+        if code:
+            emitted = True
+            yield RenderBlock(kind="code", body=code, language=language.strip() or None)
 
-def _render_text_block(block: RenderBlock) -> str:
-    raw_lines = [line.strip() for line in block.body.splitlines() if line.strip()]
-    escaped_lines = [_render_inline_markup(line) for line in raw_lines]
-    if not escaped_lines:
-        return ""
+        cursor = end
 
-    command_like_count = sum(1 for line in raw_lines if _COMMAND_LINE_RE.match(line))
-    if command_like_count >= 2:
-        joined = " \\\\\n".join(escaped_lines)
-        return f"{joined}\\par"
+    for block in _iter_plain_text_blocks(normalized[cursor:]):
+        emitted = True
+        yield block
 
-    joined = _render_inline_markup(" ".join(raw_lines))
-    return f"{joined}\\par"
+    if not emitted:
+        yield RenderBlock(kind="text", body=normalized)
 
 
 def _render_list_block(block: RenderBlock) -> str:
     environment = "itemize" if block.kind == "ulist" else "enumerate"
-    lines = [line.strip() for line in block.body.splitlines() if line.strip()]
-    items = [rf"\item {_render_inline_markup(line)}" for line in lines]
+    lines = [stripped for line in block.body.splitlines() if (stripped := line.strip())]
+    items = [rf"\item {item}" for item in _render_inline_lines(lines)]
 
-    return "\n".join(
-        [
-            rf"\begin{{{environment}}}",
-            *items,
-            rf"\end{{{environment}}}",
-        ]
-    )
+    return "\n".join([rf"\begin{{{environment}}}", *items, rf"\end{{{environment}}}"])
 
 
 def _render_heading_block(block: RenderBlock) -> str:
@@ -258,23 +399,7 @@ def _render_heading_block(block: RenderBlock) -> str:
 def _listings_language(language: str | None) -> str:
     if language is None:
         return ""
-
-    normalized = language.strip().lower()
-    mapping = {
-        "py": "Python",
-        "python": "Python",
-        "js": "Java",
-        "javascript": "Java",
-        "ts": "Java",
-        "typescript": "Java",
-        "json": "",
-        "bash": "",
-        "sh": "",
-    }
-    mapped = mapping.get(normalized, "")
-    if not mapped:
-        return ""
-    return f"[language={mapped}]"
+    return _LISTINGS_OPTION.get(language.strip().lower(), "")
 
 
 def _render_code_block(block: RenderBlock) -> str:
@@ -286,11 +411,21 @@ def _render_code_block(block: RenderBlock) -> str:
 
 def _render_content_blocks(text: str) -> list[str]:
     rendered: list[str] = []
+    # Prose paragraphs hold their raw text until the end, when all of them are
+    # rendered in a single _render_inline_lines pass instead of one call each.
+    prose_slots: list[int] = []
 
-    for block in _parse_content_blocks(text):
+    for block in _iter_content_blocks(text):
         if block.kind == "text":
-            rendered_block = _render_text_block(block)
-        elif block.kind in {"ulist", "olist"}:
+            paragraph = " ".join(
+                stripped for line in block.body.splitlines() if (stripped := line.strip())
+            )
+            if paragraph:
+                prose_slots.append(len(rendered))
+                rendered.append(paragraph)
+            continue
+
+        if block.kind in {"ulist", "olist"}:
             rendered_block = _render_list_block(block)
         elif block.kind == "heading":
             rendered_block = _render_heading_block(block)
@@ -300,6 +435,10 @@ def _render_content_blocks(text: str) -> list[str]:
         if rendered_block:
             rendered.append(rendered_block)
 
+    paragraphs = _render_inline_lines([rendered[slot] for slot in prose_slots])
+    for slot, paragraph in zip(prose_slots, paragraphs):
+        rendered[slot] = f"{paragraph}\\par"
+
     return rendered
 
 
@@ -324,7 +463,7 @@ def _render_article_header(
             rf"\noindent\textbf{{\large Article {article_index}/{total_articles}}}\hfill\texttt{{{article.status_id}}}\\",
             rf"\textbf{{{latex_escape(article.author_name)}}} {latex_escape(article.author_handle)}\\",
             rf"\textit{{Published:}} {latex_escape(_date_display(article.published_at))}\\",
-            rf"\textit{{Source:}} \href{{{article.url}}}{{\nolinkurl{{{latex_escape(source_label)}}}}}",
+            rf"\textit{{Source:}} \href{{{_href_url(article.url)}}}{{\nolinkurl{{{latex_escape(source_label)}}}}}",
             r"\vspace{1.6mm}",
         ]
     )
@@ -341,34 +480,107 @@ def _render_single_inline_image(image: LocalMedia) -> str:
     )
 
 
-def _render_single_span_image(image: LocalMedia) -> str:
-    return "\n".join(
+def _span_image_lines(images: list[LocalMedia]) -> list[str]:
+    lines: list[str] = []
+    for image in images:
+        lines.extend(
+            (
+                r"\begin{center}",
+                rf"\includegraphics[width=0.72\textwidth]{{\detokenize{{{_latex_path(image.local_path)}}}}}",
+                r"\end{center}",
+                r"\vspace{2.4mm}",
+            )
+        )
+    return lines
+
+
+def _render_appendix(images: list[LocalMedia]) -> str:
+    return "\n".join(_span_image_lines(images))
+
+
+def _iter_inline_flow(content_blocks: list[str], images: list[LocalMedia]) -> Iterator[str]:
+    image_iter = iter(images)
+
+    for block_index, block in enumerate(content_blocks, start=1):
+        yield block
+
+        if block_index == 1 or block_index % 2 == 0:
+            image = next(image_iter, None)
+            if image is not None:
+                yield _render_single_inline_image(image)
+
+    for image in image_iter:
+        yield _render_single_inline_image(image)
+
+
+def _render_inline_flow(content_blocks: list[str], images: list[LocalMedia]) -> str:
+    # Parts are written straight into one buffer instead of collected for a join.
+    buffer = io.StringIO()
+    for index, part in enumerate(_iter_inline_flow(content_blocks, images)):
+        if index:
+            buffer.write("\n\n")
+        buffer.write(part)
+    return buffer.getvalue()
+
+
+_MULTICOLS_CLOSE = r"\end{multicols*}"
+
+
+@lru_cache(maxsize=8)
+def _multicols_open(columns: int) -> str:
+    # Every article opens the same column environment; format it once per count.
+    return f"\\begin{{multicols*}}{{{columns}}}\n\\raggedright"
+
+
+def _inline_layout_block(
+    header: str, content_blocks: list[str], images: list[LocalMedia], columns: int
+) -> tuple[str, list[LocalMedia]]:
+    body = "\n".join(
         [
-            r"\begin{center}",
-            rf"\includegraphics[width=0.72\textwidth]{{\detokenize{{{_latex_path(image.local_path)}}}}}",
-            r"\end{center}",
-            r"\vspace{2.4mm}",
+            _multicols_open(columns),
+            header,
+            _render_inline_flow(content_blocks, images),
+            _MULTICOLS_CLOSE,
         ]
     )
+    return body, []
 
 
-def _render_inline_flow(content_blocks: list[str], images: list[LocalMedia]) -> str:
-    parts: list[str] = []
-    image_index = 0
+def _span_layout_block(
+    header: str, content_blocks: list[str], images: list[LocalMedia], columns: int
+) -> tuple[str, list[LocalMedia]]:
+    body = "\n".join(
+        [
+            _multicols_open(columns),
+            header,
+            "\n\n".join(content_blocks),
+            _MULTICOLS_CLOSE,
+            # An image-less span article still ends with an empty line.
+            *(_span_image_lines(images) or [""]),
+        ]
+    )
+    return body, []
 
-    for block_index, block in enumerate(content_blocks, start=1):
-        parts.append(block)
 
-        should_insert_image = block_index == 1 or block_index % 2 == 0
-        if should_insert_image and image_index < len(images):
-            parts.append(_render_single_inline_image(images[image_index]))
-            image_index += 1
+def _appendix_layout_block(
+    header: str, content_blocks: list[str], images: list[LocalMedia], columns: int
+) -> tuple[str, list[LocalMedia]]:
+    body = "\n".join(
+        [
+            _multicols_open(columns),
+            header,
+            "\n\n".join(content_blocks),
+            _MULTICOLS_CLOSE,
+        ]
+    )
+    return body, images
 
-    while image_index < len(images):
-        parts.append(_render_single_inline_image(images[image_index]))
-        image_index += 1
 
-    return "\n\n".join(parts)
+_LAYOUT_BLOCKS = {
+    ImageLayoutMode.INLINE: _inline_layout_block,
+    ImageLayoutMode.SPAN: _span_layout_block,
+    ImageLayoutMode.APPENDIX: _appendix_layout_block,
+}
 
 
 def _article_block(
@@ -382,42 +594,8 @@ def _article_block(
 ) -> tuple[str, list[LocalMedia]]:
     header = _render_article_header(article, article_index, total_articles, article_label)
     content_blocks = _render_content_blocks(article.text)
-
-    if config.image_layout == ImageLayoutMode.INLINE:
-        body = "\n".join(
-            [
-                rf"\begin{{multicols*}}{{{config.columns}}}",
-                r"\raggedright",
-                header,
-                _render_inline_flow(content_blocks, images),
-                r"\end{multicols*}",
-            ]
-        )
-        return body, []
-
-    if config.image_layout == ImageLayoutMode.SPAN:
-        body = "\n".join(
-            [
-                rf"\begin{{multicols*}}{{{config.columns}}}",
-                r"\raggedright",
-                header,
-                "\n\n".join(content_blocks),
-                r"\end{multicols*}",
-                "\n".join(_render_single_span_image(image) for image in images),
-            ]
-        )
-        return body, []
-
-    body = "\n".join(
-        [
-            rf"\begin{{multicols*}}{{{config.columns}}}",
-            r"\raggedright",
-            header,
-            "\n\n".join(content_blocks),
-            r"\end{multicols*}",
-        ]
-    )
-    return body, images
+    layout_block = _LAYOUT_BLOCKS[config.image_layout]
+    return layout_block(header, content_blocks, images, config.columns)
 
 
 def render_issue_tex(
@@ -452,14 +630,10 @@ def render_issue_tex(
         blocks.append(body_block)
         appendix_images.extend(appendix)
 
-        if config.pagination == PaginationMode.NEWPAGE and index < len(contents):
-            blocks.append(r"\newpage")
-
-    template_source = files("xmag.templates").joinpath("issue.tex.j2").read_text(encoding="utf-8")
-    environment = Environment(autoescape=False, trim_blocks=True, lstrip_blocks=True)
-    template = environment.from_string(template_source)
+    # NEWPAGE articles are separated by a page break rather than just a newline.
+    separator = "\n\\newpage\n" if config.pagination == PaginationMode.NEWPAGE else "\n"
 
-    return template.render(
+    return _issue_template().render(
         paper_option=_paper_option(config.paper),
         inner_margin_mm=config.inner_margin_mm,
         outer_margin_mm=config.outer_margin_mm,
@@ -469,7 +643,10 @@ def render_issue_tex(
         blank_first_page=config.blank_first_page,
         include_index_page=config.include_index_page,
         index_entries=index_entries,
-        body_blocks=blocks,
-        appendix_images=appendix_images,
-        include_appendix=config.image_layout == ImageLayoutMode.APPENDIX,
+        body=separator.join(blocks),
+        appendix_block=(
+            _render_appendix(appendix_images)
+            if config.image_layout == ImageLayoutMode.APPENDIX
+            else ""
+        ),
     )
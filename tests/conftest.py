@@ -0,0 +1,64 @@
+import os
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from xmag.compiler import find_tectonic
+
+# Stands in for the tectonic CLI: logs its arguments, then writes the PDFs the
+# real binary would. FAKE_TECTONIC_FAIL_BUILD makes `-X build` fail and
+# FAKE_TECTONIC_STDERR_LINES makes every run fail after that many stderr lines.
+_FAKE_TECTONIC = """\
+#!{python}
+import os, re, sys
+
+args = sys.argv[1:]
+with open(os.environ["FAKE_TECTONIC_LOG"], "a", encoding="utf-8") as log:
+    log.write(" ".join(args) + "\\n")
+
+stderr_lines = int(os.environ.get("FAKE_TECTONIC_STDERR_LINES", "0"))
+if stderr_lines:
+    for number in range(1, stderr_lines + 1):
+        print(f"log line {{number}}", file=sys.stderr)
+    sys.exit(1)
+
+if args[:2] == ["-X", "build"]:
+    if os.environ.get("FAKE_TECTONIC_FAIL_BUILD"):
+        print("error: unrecognized subcommand", file=sys.stderr)
+        sys.exit(1)
+    manifest = open("Tectonic.toml", encoding="utf-8").read()
+    for name in re.findall(r'^name = "(article-[^"]+)"$', manifest, re.MULTILINE):
+        os.makedirs(os.path.join("build", name), exist_ok=True)
+        with open(os.path.join("build", name, name + ".pdf"), "w") as handle:
+            handle.write("pdf")
+    sys.exit(0)
+
+outdir = args[args.index("--outdir") + 1]
+stem = os.path.splitext(os.path.basename(args[-1]))[0]
+with open(os.path.join(outdir, stem + ".pdf"), "w") as handle:
+    handle.write("pdf")
+"""
+
+
+@pytest.fixture
+def fake_tectonic(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Put a fake tectonic first on PATH and yield the file its calls are logged to."""
+
+    if sys.platform == "win32":
+        pytest.skip("fake tectonic is a POSIX script")
+
+    bin_dir = tmp_path / "fake-bin"
+    bin_dir.mkdir()
+    executable = bin_dir / "tectonic"
+    executable.write_text(_FAKE_TECTONIC.format(python=sys.executable), encoding="utf-8")
+    executable.chmod(0o755)
+
+    log = tmp_path / "tectonic-calls.log"
+    log.touch()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("FAKE_TECTONIC_LOG", str(log))
+    find_tectonic.cache_clear()
+    yield log
+    find_tectonic.cache_clear()
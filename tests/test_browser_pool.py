@@ -0,0 +1,234 @@
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from xmag import browser_pool
+from xmag.browser_pool import acquire_context, close_pool, release_context
+
+
+class _FakeRequest:
+    def __init__(self, resource_type: str, url: str) -> None:
+        self.resource_type = resource_type
+        self.url = url
+
+
+class _FakeRoute:
+    def __init__(self, resource_type: str, url: str) -> None:
+        self.request = _FakeRequest(resource_type, url)
+        self.outcome = ""
+
+    def abort(self) -> None:
+        self.outcome = "abort"
+
+    def continue_(self) -> None:
+        self.outcome = "continue"
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self, *, fail_close: bool = False) -> None:
+        self.pages = [_FakePage(), _FakePage()]
+        self.routes: list[str] = []
+        self.handlers: dict[str, list[Callable[[Any], None]]] = {}
+        self.closed = False
+        self.fail_close = fail_close
+
+    def route(self, pattern: str, handler: Callable[[Any], None]) -> None:
+        self.routes.append(pattern)
+
+    def on(self, event: str, handler: Callable[[Any], None]) -> None:
+        self.handlers.setdefault(event, []).append(handler)
+
+    def close(self) -> None:
+        self.closed = True
+        for handler in self.handlers.get("close", []):
+            handler(self)
+        if self.fail_close:
+            raise RuntimeError("close failed")
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def new_context(self, **kwargs: Any) -> _FakeContext:
+        return _FakeContext()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeChromium:
+    def __init__(self, fail_close: bool) -> None:
+        self.fail_close = fail_close
+        self.browser: _FakeBrowser | None = None
+        self.persistent_context: _FakeContext | None = None
+
+    def launch(self, *, headless: bool) -> _FakeBrowser:
+        self.browser = _FakeBrowser()
+        return self.browser
+
+    def connect_over_cdp(self, endpoint: str) -> _FakeBrowser:
+        self.browser = _FakeBrowser()
+        return self.browser
+
+    def launch_persistent_context(self, user_data_dir: str, **kwargs: Any) -> _FakeContext:
+        self.persistent_context = _FakeContext(fail_close=self.fail_close)
+        return self.persistent_context
+
+
+class _FakePlaywright:
+    def __init__(self, fail_close: bool) -> None:
+        self.chromium = _FakeChromium(fail_close)
+        self.stopped = False
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+class _FakeLauncher:
+    """Replaces sync_playwright() and records every Playwright it starts."""
+
+    def __init__(self) -> None:
+        self.started: list[_FakePlaywright] = []
+        self.fail_close = False
+
+    def __call__(self) -> "_FakeLauncher":
+        return self
+
+    def start(self) -> _FakePlaywright:
+        playwright = _FakePlaywright(self.fail_close)
+        self.started.append(playwright)
+        return playwright
+
+
+@pytest.fixture
+def launcher(monkeypatch: pytest.MonkeyPatch) -> _FakeLauncher:
+    fake = _FakeLauncher()
+    monkeypatch.setattr(browser_pool, "sync_playwright", fake)
+    # Sessions are thread-local; start clean and drop whatever the test leaves behind.
+    monkeypatch.setattr(browser_pool._LOCAL, "session", None, raising=False)
+    return fake
+
+
+@pytest.mark.parametrize(
+    ("resource_type", "url", "outcome"),
+    [
+        ("document", "https://x.com/a/status/1", "continue"),
+        ("script", "https://abs.twimg.com/main.js", "continue"),
+        ("font", "https://abs.twimg.com/font.woff2", "abort"),
+        ("stylesheet", "https://abs.twimg.com/app.css", "abort"),
+        ("media", "https://video.twimg.com/clip.mp4", "abort"),
+        ("image", "https://abs.twimg.com/emoji/1f600.svg", "abort"),
+        ("image", "https://pbs.twimg.com/media/abc?format=jpg", "continue"),
+    ],
+)
+def test_route_essential_only_blocks_heavy_resources(
+    resource_type: str, url: str, outcome: str
+) -> None:
+    route = _FakeRoute(resource_type, url)
+
+    browser_pool._route_essential_only(route)
+
+    assert route.outcome == outcome
+
+
+def test_acquire_context_reuses_browser_until_settings_change(
+    launcher: _FakeLauncher, tmp_path: Path
+) -> None:
+    first = acquire_context(headless=True)
+    second = acquire_context(headless=True)
+
+    assert first is not second
+    assert first.routes == ["**/*"]
+    assert len(launcher.started) == 1
+
+    acquire_context(headless=False)
+    acquire_context(headless=False, cdp_endpoint="http://localhost:9222")
+    acquire_context(headless=False, user_data_dir=tmp_path / "profile")
+
+    assert len(launcher.started) == 4
+    assert [playwright.stopped for playwright in launcher.started] == [True, True, True, False]
+    assert launcher.started[0].chromium.browser is not None
+    assert launcher.started[0].chromium.browser.closed
+
+
+def test_acquire_context_relaunches_disconnected_browser(launcher: _FakeLauncher) -> None:
+    acquire_context()
+    browser = launcher.started[0].chromium.browser
+    assert browser is not None
+    browser.connected = False
+
+    acquire_context()
+
+    assert len(launcher.started) == 2
+    assert launcher.started[0].stopped
+
+
+def test_persistent_context_is_shared_unrouted_and_only_loses_pages(
+    launcher: _FakeLauncher, tmp_path: Path
+) -> None:
+    context = acquire_context(user_data_dir=tmp_path / "profile")
+
+    assert acquire_context(user_data_dir=tmp_path / "profile") is context
+    assert context.routes == []
+
+    release_context(context)
+
+    assert all(page.closed for page in context.pages)
+    assert not context.closed
+    assert len(launcher.started) == 1
+
+
+def test_release_context_closes_pooled_browser_contexts(launcher: _FakeLauncher) -> None:
+    context = acquire_context()
+
+    release_context(context)
+
+    assert context.closed
+    browser = launcher.started[0].chromium.browser
+    assert browser is not None
+    assert not browser.closed
+
+
+def test_close_pool_stops_playwright_even_when_close_raises(
+    launcher: _FakeLauncher, tmp_path: Path
+) -> None:
+    launcher.fail_close = True
+    acquire_context(user_data_dir=tmp_path / "profile")
+
+    with pytest.raises(RuntimeError, match="close failed"):
+        close_pool()
+
+    assert launcher.started[0].stopped
+    assert browser_pool._LOCAL.session is None
+    close_pool()
+
+
+def test_acquire_context_relaunches_closed_persistent_profile(
+    launcher: _FakeLauncher, tmp_path: Path
+) -> None:
+    profile = tmp_path / "profile"
+    context = acquire_context(user_data_dir=profile)
+    # Chromium exits or the user closes the headful window mid-build.
+    context.close()
+    release_context(context)
+
+    relaunched = acquire_context(user_data_dir=profile)
+
+    assert relaunched is not context
+    assert not relaunched.closed
+    assert len(launcher.started) == 2
+    assert launcher.started[0].stopped
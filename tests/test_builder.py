@@ -0,0 +1,216 @@
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from xmag import builder
+from xmag.config import LayoutConfig, PaginationMode
+from xmag.extractor import ArticleExtractionError
+from xmag.models import ArticleContent, ArticleInput
+
+
+def _article(status_id: str) -> ArticleContent:
+    return ArticleContent(
+        status_id=status_id,
+        url=f"https://x.com/alice/status/{status_id}",
+        author_name="Alice",
+        author_handle="@alice",
+        published_at=datetime(2026, 2, 20, 12, 0, tzinfo=timezone.utc),
+        text=f"Article {status_id} body.",
+        media_urls=[],
+    )
+
+
+def _stub_extraction(monkeypatch: pytest.MonkeyPatch, contents: list[ArticleContent]) -> None:
+    def fake_extract_contents(**kwargs: Any) -> tuple[list[ArticleContent], list[str], int]:
+        for article in contents:
+            kwargs["on_extracted"](article)
+        return contents, [], len(contents)
+
+    monkeypatch.setattr(builder, "_extract_contents", fake_extract_contents)
+
+
+def _build_split(tmp_path: Path) -> list[Path]:
+    report = builder.build_issue(
+        tmp_path / "urls.txt",
+        tmp_path / "out" / "issue.pdf",
+        LayoutConfig(pagination=PaginationMode.SPLIT),
+    )
+    return report.outputs
+
+
+def test_split_build_compiles_all_articles_in_one_project(
+    tmp_path: Path, fake_tectonic: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _stub_extraction(monkeypatch, [_article("111"), _article("222")])
+
+    outputs = _build_split(tmp_path)
+
+    assert outputs == [
+        tmp_path / "out" / "issue-001-111.pdf",
+        tmp_path / "out" / "issue-002-222.pdf",
+    ]
+    assert all(output.read_text() == "pdf" for output in outputs)
+    assert fake_tectonic.read_text().splitlines() == ["-X build"]
+
+
+def test_split_build_falls_back_to_per_article_compiles(
+    tmp_path: Path, fake_tectonic: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FAKE_TECTONIC_FAIL_BUILD", "1")
+    _stub_extraction(monkeypatch, [_article("111"), _article("222")])
+
+    outputs = _build_split(tmp_path)
+
+    assert all(output.read_text() == "pdf" for output in outputs)
+    calls = fake_tectonic.read_text().splitlines()
+    assert calls[0] == "-X build"
+    assert sorted(Path(call.split()[-1]).name for call in calls[1:]) == [
+        "article-001-111.tex",
+        "article-002-222.tex",
+    ]
+
+
+class _FakeContext:
+    def new_page(self) -> object:
+        return object()
+
+
+def _stub_browser(
+    monkeypatch: pytest.MonkeyPatch, failing: set[str], delays: dict[str, float]
+) -> dict[str, int]:
+    calls = {"acquired": 0, "released": 0, "closed": 0}
+    lock = threading.Lock()
+
+    def acquire_context(**kwargs: Any) -> _FakeContext:
+        with lock:
+            calls["acquired"] += 1
+        return _FakeContext()
+
+    def release_context(context: _FakeContext) -> None:
+        with lock:
+            calls["released"] += 1
+
+    def close_pool() -> None:
+        with lock:
+            calls["closed"] += 1
+
+    def extract_article(page: object, item: ArticleInput, timeout_s: int) -> ArticleContent:
+        time.sleep(delays.get(item.status_id, 0.0))
+        if item.status_id in failing:
+            raise ArticleExtractionError(f"no article {item.status_id}")
+        return _article(item.status_id)
+
+    monkeypatch.setattr(builder, "acquire_context", acquire_context)
+    monkeypatch.setattr(builder, "release_context", release_context)
+    monkeypatch.setattr(builder, "close_pool", close_pool)
+    monkeypatch.setattr(builder, "extract_article", extract_article)
+    return calls
+
+
+def _url_file(tmp_path: Path, status_ids: list[str]) -> Path:
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text(
+        "".join(f"https://x.com/alice/status/{status_id}\n" for status_id in status_ids),
+        encoding="utf-8",
+    )
+    return url_file
+
+
+def _extract(url_file: Path, concurrency: int, continue_on_error: bool) -> Any:
+    return builder._extract_contents(
+        url_file=url_file,
+        headless=True,
+        storage_state=None,
+        timeout_seconds=1,
+        continue_on_error=continue_on_error,
+        concurrency=concurrency,
+    )
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_extract_contents_keeps_input_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, concurrency: int
+) -> None:
+    status_ids = ["1", "2", "3", "4", "5"]
+    # Earlier articles finish last, so completion order differs from input order.
+    delays = {"1": 0.06, "2": 0.04, "3": 0.02}
+    calls = _stub_browser(monkeypatch, failing=set(), delays=delays)
+
+    contents, failures, total = _extract(_url_file(tmp_path, status_ids), concurrency, False)
+
+    assert [article.status_id for article in contents] == status_ids
+    assert failures == []
+    assert total == 5
+    assert calls["acquired"] == calls["released"] == concurrency
+    # Only worker threads shut their browsers down; the inline worker keeps its own.
+    assert calls["closed"] == (concurrency if concurrency > 1 else 0)
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_extract_contents_raises_first_failure_without_continue_on_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, concurrency: int
+) -> None:
+    # With several workers, article 3 fails first while article 2 is still loading.
+    _stub_browser(monkeypatch, failing={"2", "3"}, delays={"2": 0.05})
+
+    with pytest.raises(RuntimeError, match="status/2: no article 2") as excinfo:
+        _extract(_url_file(tmp_path, ["1", "2", "3", "4", "5"]), concurrency, False)
+
+    assert isinstance(excinfo.value.__cause__, ArticleExtractionError)
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_extract_contents_collects_failures_with_continue_on_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, concurrency: int
+) -> None:
+    _stub_browser(monkeypatch, failing={"2", "4"}, delays={"1": 0.03})
+
+    contents, failures, total = _extract(
+        _url_file(tmp_path, ["1", "2", "3", "4", "5"]), concurrency, True
+    )
+
+    assert [article.status_id for article in contents] == ["1", "3", "5"]
+    assert failures == [
+        "https://x.com/alice/status/2: no article 2",
+        "https://x.com/alice/status/4: no article 4",
+    ]
+    assert total == 5
+
+
+def test_extract_contents_stops_other_workers_when_one_fails_to_start(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    status_ids = [str(number) for number in range(1, 31)]
+    _stub_browser(monkeypatch, failing=set(), delays={status_id: 0.02 for status_id in status_ids})
+    extracted: list[str] = []
+    acquired = 0
+    lock = threading.Lock()
+
+    def acquire_context(**kwargs: Any) -> _FakeContext:
+        nonlocal acquired
+        with lock:
+            acquired += 1
+            first = acquired == 1
+        if first:
+            raise RuntimeError("browser failed to launch")
+        return _FakeContext()
+
+    monkeypatch.setattr(builder, "acquire_context", acquire_context)
+
+    with pytest.raises(RuntimeError, match="browser failed to launch"):
+        builder._extract_contents(
+            url_file=_url_file(tmp_path, status_ids),
+            headless=True,
+            storage_state=None,
+            timeout_seconds=1,
+            continue_on_error=False,
+            concurrency=3,
+            on_extracted=lambda article: extracted.append(article.status_id),
+        )
+
+    # The two healthy workers finish at most the article they were on.
+    assert len(extracted) <= 4
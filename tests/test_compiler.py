@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import pytest
+
+from xmag.compiler import (
+    TectonicCompileError,
+    compile_project_with_tectonic,
+    compile_tex_with_tectonic,
+)
+
+
+def _write_sources(project_dir: Path, stems: list[str]) -> list[Path]:
+    source_dir = project_dir / "src"
+    source_dir.mkdir(parents=True)
+    paths = [source_dir / f"{stem}.tex" for stem in stems]
+    for path in paths:
+        path.write_text(r"\documentclass{article}", encoding="utf-8")
+    return paths
+
+
+def test_compile_project_writes_manifest_and_places_outputs(
+    tmp_path: Path, fake_tectonic: Path
+) -> None:
+    project_dir = tmp_path / "work"
+    first, second = _write_sources(project_dir, ["article-001-111", "article-002-222"])
+    outputs = [tmp_path / "out" / "issue-001-111.pdf", tmp_path / "out" / "issue-002-222.pdf"]
+
+    compile_project_with_tectonic(
+        project_dir,
+        [(first, outputs[0]), (second, outputs[1])],
+        cache_dir=tmp_path / "cache",
+        only_cached=True,
+    )
+
+    manifest = (project_dir / "Tectonic.toml").read_text(encoding="utf-8")
+    assert manifest.startswith(
+        '[doc]\nname = "xmag"\nbundle = "https://relay.fullyjustified.net/default_bundle_v33.tar"\n'
+    )
+    assert manifest.count("[[output]]") == 2
+    assert 'name = "article-001-111"\ntype = "pdf"\ninputs = ["article-001-111.tex"]' in manifest
+    assert 'name = "article-002-222"\ntype = "pdf"\ninputs = ["article-002-222.tex"]' in manifest
+
+    assert all(output.read_text() == "pdf" for output in outputs)
+    assert not (project_dir / "build" / "article-001-111" / "article-001-111.pdf").exists()
+    assert fake_tectonic.read_text().splitlines() == ["-X build --only-cached"]
+
+
+def test_compile_project_rejects_inputs_outside_src(tmp_path: Path, fake_tectonic: Path) -> None:
+    project_dir = tmp_path / "work"
+    _write_sources(project_dir, [])
+    stray = tmp_path / "article-001-111.tex"
+    stray.write_text("", encoding="utf-8")
+
+    with pytest.raises(TectonicCompileError, match="must live in"):
+        compile_project_with_tectonic(project_dir, [(stray, tmp_path / "out.pdf")])
+
+    assert fake_tectonic.read_text() == ""
+
+
+def test_compile_tex_moves_pdf_to_output_path(tmp_path: Path, fake_tectonic: Path) -> None:
+    tex_path = tmp_path / "issue.tex"
+    tex_path.write_text("", encoding="utf-8")
+    output = tmp_path / "out" / "final.pdf"
+
+    compile_tex_with_tectonic(tex_path, output, only_cached=True)
+
+    assert output.read_text() == "pdf"
+    assert not (output.parent / "issue.pdf").exists()
+    assert fake_tectonic.read_text().startswith("--only-cached --outdir ")
+
+
+def test_compile_error_reports_only_the_end_of_stderr(
+    tmp_path: Path, fake_tectonic: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FAKE_TECTONIC_STDERR_LINES", "600")
+    tex_path = tmp_path / "issue.tex"
+    tex_path.write_text("", encoding="utf-8")
+
+    with pytest.raises(TectonicCompileError) as excinfo:
+        compile_tex_with_tectonic(tex_path, tmp_path / "issue.pdf")
+
+    message = str(excinfo.value)
+    assert message.startswith("log line 89\n")
+    assert message.endswith("log line 600")
+    assert "log line 88\n" not in message
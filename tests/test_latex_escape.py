@@ -15,3 +15,12 @@ def test_latex_escape_special_characters() -> None:
     assert r"\textbackslash{}" in escaped
     assert r"\textasciitilde{}" in escaped
     assert r"\textasciicircum{}" in escaped
+
+
+def test_latex_escape_exact_output() -> None:
+    text = r"a\b&c%d$e#f_g{h}i~j^k plain"
+
+    assert latex_escape(text) == (
+        r"a\textbackslash{}b\&c\%d\$e\#f\_g\{h\}i\textasciitilde{}j\textasciicircum{}k plain"
+    )
+    assert latex_escape("nothing to escape") == "nothing to escape"
@@ -0,0 +1,120 @@
+from pathlib import Path
+from typing import Iterator
+
+import httpx
+import pytest
+
+from xmag.media import (
+    MediaDownloadError,
+    create_media_client,
+    download_media,
+    normalize_media_url,
+)
+
+
+def test_normalize_media_url_returns_canonical_urls_unchanged() -> None:
+    url = "https://pbs.twimg.com/media/abc?format=jpg&name=orig"
+
+    assert normalize_media_url(url) == url
+
+
+def test_normalize_media_url_requests_original_size() -> None:
+    assert (
+        normalize_media_url("https://pbs.twimg.com/media/abc?format=png&name=small")
+        == "https://pbs.twimg.com/media/abc?format=png&name=orig"
+    )
+    assert (
+        normalize_media_url("https://pbs.twimg.com/media/abc?name=small&format=webp#frag")
+        == "https://pbs.twimg.com/media/abc?format=webp&name=orig"
+    )
+
+
+def test_normalize_media_url_takes_format_from_path_or_defaults_to_jpg() -> None:
+    assert (
+        normalize_media_url("https://pbs.twimg.com/media/abc.png")
+        == "https://pbs.twimg.com/media/abc.png?format=png&name=orig"
+    )
+    assert (
+        normalize_media_url("https://pbs.twimg.com/media/abc")
+        == "https://pbs.twimg.com/media/abc?format=jpg&name=orig"
+    )
+
+
+def test_normalize_media_url_reparses_canonical_looking_urls_with_whitespace() -> None:
+    # urlparse drops tabs, so such URLs must not take the unchanged fast path.
+    assert (
+        normalize_media_url("https://pbs.twimg.com/media/a\tbc?format=jpg&name=orig")
+        == "https://pbs.twimg.com/media/abc?format=jpg&name=orig"
+    )
+
+
+def test_create_media_client_waits_for_free_connections() -> None:
+    with create_media_client() as client:
+        assert client.timeout.pool is None
+        assert client.timeout.read == 20.0
+
+
+def _client(handler: httpx.MockTransport) -> httpx.Client:
+    return httpx.Client(transport=handler)
+
+
+def test_download_media_dedupes_and_keeps_order(tmp_path: Path) -> None:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        return httpx.Response(200, content=request.url.path.encode())
+
+    urls = [
+        "https://pbs.twimg.com/media/first?format=jpg&name=small",
+        "https://pbs.twimg.com/media/second.png",
+        "https://pbs.twimg.com/media/first?format=jpg&name=small",
+        "https://pbs.twimg.com/media/th!rd?format=jpg&name=orig",
+    ]
+    with _client(httpx.MockTransport(handler)) as client:
+        media = download_media(urls, tmp_path / "media", client=client)
+
+    assert [item.local_path.name for item in media] == [
+        "001_first.jpg",
+        "002_second.png",
+        "003_th_rd.jpg",
+    ]
+    assert [item.source_url for item in media] == [
+        "https://pbs.twimg.com/media/first?format=jpg&name=orig",
+        "https://pbs.twimg.com/media/second.png?format=png&name=orig",
+        "https://pbs.twimg.com/media/th!rd?format=jpg&name=orig",
+    ]
+    assert media[1].local_path.read_bytes() == b"/media/second.png"
+    assert sorted(requested) == ["/media/first", "/media/second.png", "/media/th!rd"]
+
+
+class _BrokenStream(httpx.SyncByteStream):
+    def __iter__(self) -> Iterator[bytes]:
+        yield b"partial"
+        raise httpx.ReadError("connection reset")
+
+
+def test_download_media_removes_partial_file_after_failure(tmp_path: Path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=_BrokenStream())
+
+    out_dir = tmp_path / "media"
+    with _client(httpx.MockTransport(handler)) as client:
+        with pytest.raises(MediaDownloadError, match="connection reset"):
+            download_media(["https://pbs.twimg.com/media/abc.jpg"], out_dir, client=client)
+
+    assert list(out_dir.iterdir()) == []
+
+
+def test_download_media_raises_on_http_error(tmp_path: Path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = 404 if "missing" in request.url.path else 200
+        return httpx.Response(status, content=b"image")
+
+    urls = ["https://pbs.twimg.com/media/ok.jpg", "https://pbs.twimg.com/media/missing.jpg"]
+    out_dir = tmp_path / "media"
+    with _client(httpx.MockTransport(handler)) as client:
+        with pytest.raises(MediaDownloadError, match="missing"):
+            download_media(urls, out_dir, client=client)
+
+    assert not (out_dir / "002_missing.jpg").exists()
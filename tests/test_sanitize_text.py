@@ -0,0 +1,32 @@
+from xmag.extractor import _sanitize_text
+
+
+def test_sanitize_text_strips_artifacts_and_author_lines() -> None:
+    raw = "\n".join(
+        [
+            "Alice @alice 1.2K 30 First paragraph of the article.",
+            "",
+            "",
+            "@alice",
+            "",
+            "Second paragraph postComment(x) with ${trigger} noise.",
+            "1.2K",
+            "Third paragraph.",
+        ]
+    )
+
+    assert _sanitize_text(raw, "Alice", "@alice") == (
+        "First paragraph of the article.\n\nSecond paragraph   with   noise.\nThird paragraph."
+    )
+
+
+def test_sanitize_text_stops_at_footer_lines() -> None:
+    raw = "Body text.\n\nRead 12 replies\nReply that should be dropped."
+
+    assert _sanitize_text(raw, "Alice", "@alice") == "Body text."
+
+
+def test_sanitize_text_drops_everything_after_indented_timestamp_line() -> None:
+    raw = "Body text.\n  10:30 AM · Jan 1, 2025\n" + "Recommended post text.\n" * 50
+
+    assert _sanitize_text(raw, "Alice", "@alice") == "Body text."
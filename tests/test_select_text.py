@@ -0,0 +1,81 @@
+import pytest
+
+from xmag.extractor import ArticleExtractionError, _select_text
+
+_PRIMARY = '[data-testid="tweetText"]'
+_FIRST = "The first paragraph of the article, long enough to count."
+_SECOND = "The second paragraph of the article."
+
+
+def _no_fallback() -> str:
+    return ""
+
+
+def test_select_text_returns_deduped_primary_candidates() -> None:
+    candidates = {
+        _PRIMARY: [f"  {_FIRST}  ", _SECOND, _FIRST, "short"],
+        "div[lang]": [_FIRST + " " + _SECOND + " And a much longer tail of text."],
+    }
+
+    text = _select_text(candidates, _no_fallback, "Alice", "@alice")
+
+    assert text == f"{_FIRST}\n\n{_SECOND}"
+
+
+def test_select_text_uses_longest_secondary_candidate_when_primary_is_short() -> None:
+    candidates = {
+        _PRIMARY: ["Only a brief line."],
+        "div[lang]": ["A secondary candidate.", "A longer secondary candidate wins."],
+    }
+
+    text = _select_text(candidates, _no_fallback, "Alice", "@alice")
+
+    assert text == "A longer secondary candidate wins."
+
+
+def test_select_text_falls_back_to_article_text_when_candidates_are_short() -> None:
+    candidates = {_PRIMARY: ["tiny", "too short"], 'div[dir="auto"]': ["also short"]}
+
+    def fallback() -> str:
+        return f"Alice\n@alice\n{_FIRST}\n\n{_SECOND}\n1.2K\nRead 4 replies"
+
+    text = _select_text(candidates, fallback, "Alice", "@alice")
+
+    assert text == f"{_FIRST}\n\n{_SECOND}"
+
+
+def test_select_text_raises_when_nothing_is_usable() -> None:
+    with pytest.raises(ArticleExtractionError, match="usable text"):
+        _select_text({_PRIMARY: ["short"]}, _no_fallback, "Alice", "@alice")
+
+
+class _RecordingFallback:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        return self.text
+
+
+def test_select_text_skips_fallback_when_primary_candidate_qualifies() -> None:
+    fallback = _RecordingFallback(f"{_FIRST}\n\n{_SECOND}\n\nMore text from the whole article.")
+
+    _select_text({_PRIMARY: [_FIRST]}, fallback, "Alice", "@alice")
+
+    assert fallback.calls == 0
+
+
+def test_select_text_reads_fallback_once_when_no_primary_candidate_qualifies() -> None:
+    fallback = _RecordingFallback(f"{_FIRST}\n\n{_SECOND}")
+
+    text = _select_text(
+        {_PRIMARY: ["Too short to qualify."], "div[lang]": ["Another short one."]},
+        fallback,
+        "Alice",
+        "@alice",
+    )
+
+    assert text == f"{_FIRST}\n\n{_SECOND}"
+    assert fallback.calls == 1
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from xmag.config import ImageLayoutMode, LayoutConfig, PaginationMode
@@ -104,3 +104,30 @@ def test_render_issue_tex_supports_index_page_option(tmp_path: Path) -> None:
     assert r"\section*{Index}" in tex
     assert "Article 1" in tex
     assert r"\pageref{article-111}" in tex
+
+
+def test_render_issue_tex_keeps_time_zones_of_equal_instants_apart(tmp_path: Path) -> None:
+    utc_article, other_article = _sample_contents()
+    utc_article = utc_article.model_copy(
+        update={"published_at": datetime(2026, 2, 20, 12, 0, tzinfo=timezone.utc)}
+    )
+    other_article = other_article.model_copy(
+        update={"published_at": datetime(2026, 2, 20, 14, 0, tzinfo=timezone(timedelta(hours=2)))}
+    )
+    tex = render_issue_tex([utc_article, other_article], _media_map(tmp_path), LayoutConfig())
+
+    assert "2026-02-20 12:00:00 UTC" in tex
+    assert "2026-02-20 14:00:00 UTC+02:00" in tex
+
+
+def test_render_issue_tex_escapes_percent_and_hash_in_link_urls(tmp_path: Path) -> None:
+    article = _sample_contents()[1].model_copy(
+        update={
+            "url": "https://x.com/bob/status/222?s=20#top",
+            "text": "## See [docs](https://example.com/a%20b#part)",
+        }
+    )
+    tex = render_issue_tex([article], _media_map(tmp_path), LayoutConfig())
+
+    assert r"\href{https://x.com/bob/status/222?s=20\#top}" in tex
+    assert r"\href{https://example.com/a\%20b\#part}{docs}" in tex
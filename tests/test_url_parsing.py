@@ -11,6 +11,24 @@ def test_parse_status_id_accepts_x_and_twitter_hosts() -> None:
     assert parse_status_id("https://www.x.com/user/status/100") == "100"
 
 
+def test_parse_status_id_accepts_any_case_scheme_and_host() -> None:
+    assert parse_status_id("HTTPS://X.com/alice/status/12345") == "12345"
+    assert parse_status_id("https://WWW.Twitter.COM/bob/status/9999") == "9999"
+
+
+def test_parse_status_id_rejects_non_lowercase_status_segment() -> None:
+    with pytest.raises(ValueError):
+        parse_status_id("https://x.com/a/STATUS/123")
+
+    with pytest.raises(ValueError):
+        parse_status_id("https://x.com/a/Status/1")
+
+
+def test_parse_status_id_reads_the_first_status_segment() -> None:
+    with pytest.raises(ValueError, match="not numeric"):
+        parse_status_id("https://x.com/status/status/1")
+
+
 def test_parse_status_id_rejects_invalid_url() -> None:
     with pytest.raises(ValueError):
         parse_status_id("https://example.com/alice/status/12345")